@@ -19,9 +19,9 @@ get_header();
 <nav class="main-nav"><?php
 wp_nav_menu(array(
     'theme_location' => 'main_nav',
-    'menu_class'     =&gt; 'nav-menu',
-    'container'      =&gt; false,
-    'fallback_cb'    =&gt; false,
+    'menu_class'     => 'nav-menu',
+    'container'      => false,
+    'fallback_cb'    => false,
 ));
 ?></nav>
 </div>
@@ -99,9 +99,9 @@ wp_nav_menu(array(
 <nav class="menu"><?php
 wp_nav_menu(array(
     'theme_location' => 'menu',
-    'menu_class'     =&gt; 'menu',
-    'container'      =&gt; false,
-    'fallback_cb'    =&gt; false,
+    'menu_class'     => 'menu',
+    'container'      => false,
+    'fallback_cb'    => false,
 ));
 ?></nav>
 </div>
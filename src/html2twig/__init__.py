@@ -5,7 +5,18 @@ HTML2Twig - Convert HTML templates to Twig (Symfony) or WordPress PHP templates.
 __version__ = "1.0.0"
 __author__ = "HTML2Twig Contributors"
 
-from .converter import HTMLToTwigConverter
-from .wordpress_converter import HTMLToWordPressConverter
-
 __all__ = ["HTMLToTwigConverter", "HTMLToWordPressConverter", "__version__"]
+
+
+def __getattr__(name):
+    # Import the converters on first access so that importing the package
+    # (e.g. for the CLI's --version) does not load BeautifulSoup and lxml.
+    if name == "HTMLToTwigConverter":
+        from .converter import HTMLToTwigConverter
+
+        return HTMLToTwigConverter
+    if name == "HTMLToWordPressConverter":
+        from .wordpress_converter import HTMLToWordPressConverter
+
+        return HTMLToWordPressConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,31 +2,73 @@
 CLI interface for HTML2Twig converter.
 """
 
+import hashlib
+import json
+import mmap
+import os
 import sys
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, ContextManager, Dict, Optional, Union
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .converter import HTMLToTwigConverter
-from .wordpress_converter import HTMLToWordPressConverter
+from . import __version__
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
+# Rich, the converters and the process pool are imported where they are
+# used, so quick invocations such as --version start without loading them.
 
-def print_banner():
-    """Print the application banner."""
-    banner = """
+
+@lru_cache(maxsize=None)
+def _rich_console():
+    """Create the Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+class _LazyConsole:
+    """Forward to the Rich console, importing Rich only once output is printed."""
+
+    def __getattr__(self, name):
+        return getattr(_rich_console(), name)
+
+
+console = _LazyConsole()
+
+# Inputs below this size are converted without a progress spinner
+_PROGRESS_MIN_SIZE = 64 * 1024
+
+# Inputs of at least this size are memory-mapped instead of read
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Part of every cache key; bumped when the stored entry format changes
+_CACHE_FORMAT = 5
+
+_BANNER_TEXT = """
 ╦ ╦╔╦╗╔╦╗╦  ┌─┐  ╔╦╗┬ ┬┬┌─┐
 ╠═╣ ║ ║║║║  ┌─┘   ║ ││││├─┐
 ╩ ╩ ╩ ╩ ╩╩═╝└─┘   ╩ └┴┘┴└─┘
     HTML to Twig/WordPress Converter
     """
-    console.print(Panel(banner, style="bold blue"))
+
+
+@lru_cache(maxsize=None)
+def _banner_panel():
+    """Build the banner panel once."""
+    from rich.panel import Panel
+
+    return Panel(_BANNER_TEXT, style="bold blue")
+
+
+def print_banner():
+    """Print the application banner."""
+    console.print(_banner_panel())
 
 
 @click.group(invoke_without_command=True)
@@ -44,8 +86,7 @@ def main(ctx, version):
         html2twig init --symfony
     """
     if version:
-        from . import __version__
-        console.print(f"html2twig version {__version__}")
+        click.echo(f"html2twig version {__version__}")
         sys.exit(0)
 
     if ctx.invoked_subcommand is None:
@@ -78,6 +119,11 @@ def main(ctx, version):
     is_flag=True,
     help="Skip generating the conversion report"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always reconvert instead of reusing cached output"
+)
 @click.option(
     "--verbose", "-V",
     is_flag=True,
@@ -90,6 +136,7 @@ def convert(
     wordpress: bool,
     theme_name: str,
     no_report: bool,
+    no_cache: bool,
     verbose: bool,
 ):
     """
@@ -129,42 +176,53 @@ def convert(
         console.print(f"[bold]Theme:[/bold] {theme_name}")
     console.print()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Converting...", total=None)
+    # Small files convert faster than a spinner can be drawn, so the Progress
+    # display is only started for larger inputs or in verbose mode
+    status: ContextManager[Optional[Progress]]
+    if verbose or input_path.stat().st_size >= _PROGRESS_MIN_SIZE:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        status = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=_rich_console(),
+        )
+    else:
+        status = nullcontext()
 
-        try:
-            if wordpress:
-                converter = HTMLToWordPressConverter(theme_name=theme_name)
-            else:
-                converter = HTMLToTwigConverter(layout=layout)
+    with status as progress:
+        if progress is not None:
+            task = progress.add_task("Converting...", total=None)
 
-            content, report = converter.convert_file(
+        try:
+            report = _convert_one(
                 str(input_path),
                 str(output_path),
+                wordpress,
+                layout,
+                theme_name,
                 generate_report=not no_report,
+                use_cache=not no_cache,
             )
 
-            progress.update(task, description="[green]Conversion complete!")
+            if progress is not None:
+                progress.update(task, description="[green]Conversion complete!")
 
         except Exception as e:
-            progress.update(task, description="[red]Conversion failed!")
+            if progress is not None:
+                progress.update(task, description="[red]Conversion failed!")
             console.print(f"\n[red]Error:[/red] {str(e)}")
             if verbose:
                 import traceback
                 console.print(traceback.format_exc())
             sys.exit(1)
 
-    # Display summary
-    console.print()
-    _display_summary(report, verbose, wordpress)
-
-    # Show report location
+    # Display summary and report location; with --no-report there is nothing to show
     if not no_report:
-        report_path = str(output_path).rsplit(".", 1)[0] + "_report.txt"
+        console.print()
+        _display_summary(report, verbose, wordpress)
+
+        report_path = _report_path(output_path)
         console.print(f"\n[bold]Report saved to:[/bold] {report_path}")
 
     console.print("\n[green]✓[/green] Conversion completed successfully!")
@@ -174,17 +232,16 @@ def _display_summary(report, verbose: bool, is_wordpress: bool):
     """Display a summary of the conversion."""
     # Asset conversions table
     if report.asset_conversions:
+        from rich.table import Table
+
         table = Table(title="Asset Conversions", show_header=True)
-        table.add_column("Type", style="cyan")
-        table.add_column("Original", style="dim")
-        table.add_column("Converted", style="green")
+        table.add_column("Type", style="cyan", no_wrap=True)
+        # Long paths are cut by Rich when the table is rendered
+        table.add_column("Original", style="dim", max_width=43, overflow="ellipsis")
+        table.add_column("Converted", style="green", max_width=53, overflow="ellipsis")
 
         for conv in report.asset_conversions[:10 if not verbose else None]:
-            table.add_row(
-                conv["type"].upper(),
-                conv["original"][:40] + "..." if len(conv["original"]) > 40 else conv["original"],
-                conv["converted"][:50] + "..." if len(conv["converted"]) > 50 else conv["converted"],
-            )
+            table.add_row(conv.type.upper(), conv.original, conv.converted)
 
         if not verbose and len(report.asset_conversions) > 10:
             table.add_row("...", f"({len(report.asset_conversions) - 10} more)", "...")
@@ -197,13 +254,13 @@ def _display_summary(report, verbose: bool, is_wordpress: bool):
         if report.template_parts:
             console.print("[bold]Template Parts Detected:[/bold]")
             for part in report.template_parts:
-                console.print(f"  • {part['name']}: {part['reason']}")
+                console.print(f"  • {part.name}: {part.reason}")
             console.print()
     else:
         if report.block_suggestions:
             console.print("[bold]Block Suggestions:[/bold]")
             for block in report.block_suggestions:
-                console.print(f"  • {{% block {block['name']} %}}: {block['reason']}")
+                console.print(f"  • {{% block {block.name} %}}: {block.reason}")
             console.print()
 
     # Loop conversions
@@ -211,9 +268,9 @@ def _display_summary(report, verbose: bool, is_wordpress: bool):
         console.print("[bold]Loop Conversions:[/bold]")
         for loop in report.loop_conversions:
             if is_wordpress:
-                console.print(f"  • {loop['element']} → {loop['loop_type']}")
+                console.print(f"  • {loop.element} → {loop.loop_type}")
             else:
-                console.print(f"  • {loop['element']} → {{% for {loop['item_var']} in {loop['items_var']} %}}")
+                console.print(f"  • {loop.element} → {{% for {loop.item_var} in {loop.items_var} %}}")
         console.print()
 
     # Manual suggestions
@@ -286,7 +343,9 @@ def init(symfony: bool, wordpress: bool, output: str, theme_name: str):
 def _init_symfony(output_dir: Path):
     """Initialize Symfony Twig template structure."""
     templates_dir = output_dir / "templates"
-    templates_dir.mkdir(parents=True, exist_ok=True)
+
+    # Creating the page directory also creates templates_dir itself
+    (templates_dir / "page").mkdir(parents=True, exist_ok=True)
 
     # Create base.html.twig
     base_template = templates_dir / "base.html.twig"
@@ -334,11 +393,10 @@ def _init_symfony(output_dir: Path):
 </body>
 </html>
 """
-    base_template.write_text(base_content)
+    files = [(base_template, base_content)]
 
     # Create example page template
     example_template = templates_dir / "page" / "index.html.twig"
-    example_template.parent.mkdir(parents=True, exist_ok=True)
     example_content = """{% extends 'base.html.twig' %}
 
 {% block title %}Home - {{ parent() }}{% endblock %}
@@ -356,7 +414,8 @@ def _init_symfony(output_dir: Path):
 </div>
 {% endblock %}
 """
-    example_template.write_text(example_content)
+    files.append((example_template, example_content))
+    _write_files(files)
 
     console.print("[green]✓[/green] Symfony Twig structure created:")
     console.print(f"  • {templates_dir}/base.html.twig")
@@ -369,147 +428,43 @@ def _init_symfony(output_dir: Path):
 def _init_wordpress(output_dir: Path, theme_name: str):
     """Initialize WordPress theme structure."""
     theme_dir = output_dir / theme_name
-    theme_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create subdirectories
+    # Create subdirectories; the first one also creates the theme directory,
+    # so only the leaves are created explicitly
     for subdir in ["css", "js", "images", "fonts", "template-parts"]:
-        (theme_dir / subdir).mkdir(exist_ok=True)
+        (theme_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+    from . import wordpress_templates
 
     # Create style.css (required for WordPress themes)
     style_css = theme_dir / "style.css"
-    style_css.write_text(f"""/*
-Theme Name: {theme_name.replace('_', ' ').title()}
-Theme URI: https://example.com/{theme_name}
-Author: Your Name
-Author URI: https://example.com
-Description: A custom WordPress theme converted from HTML
-Version: 1.0.0
-License: GNU General Public License v2 or later
-License URI: http://www.gnu.org/licenses/gpl-2.0.html
-Text Domain: {theme_name}
-*/
-
-/* Add your custom styles below */
-""")
+    files = [(style_css, wordpress_templates.style_css(theme_name))]
 
     # Create functions.php
-    converter = HTMLToWordPressConverter(theme_name=theme_name)
-    # Initialize a basic report for generating functions.php
-    from .wordpress_converter import WordPressConversionReport
-    converter.report = WordPressConversionReport(
-        input_file="", output_file="", theme_name=theme_name
-    )
     functions_php = theme_dir / "functions.php"
-    functions_php.write_text(converter.generate_functions_php())
+    files.append((functions_php, wordpress_templates.functions_php(theme_name)))
 
     # Create header.php
     header_php = theme_dir / "header.php"
-    header_php.write_text(converter.generate_header_php())
+    files.append((header_php, wordpress_templates.header_php(theme_name)))
 
     # Create footer.php
     footer_php = theme_dir / "footer.php"
-    footer_php.write_text(converter.generate_footer_php())
+    files.append((footer_php, wordpress_templates.footer_php(theme_name)))
 
     # Create index.php
     index_php = theme_dir / "index.php"
-    index_php.write_text(f"""<?php
-/**
- * Main template file
- *
- * @package {theme_name}
- */
-
-get_header();
-?>
-
-<div id="primary" class="content-area">
-    <?php
-    if (have_posts()) :
-        while (have_posts()) :
-            the_post();
-            get_template_part('template-parts/content', get_post_type());
-        endwhile;
-
-        the_posts_navigation();
-    else :
-        get_template_part('template-parts/content', 'none');
-    endif;
-    ?>
-</div>
-
-<?php
-get_sidebar();
-get_footer();
-""")
+    files.append((index_php, wordpress_templates.index_php(theme_name)))
 
     # Create sidebar.php
     sidebar_php = theme_dir / "sidebar.php"
-    sidebar_php.write_text(f"""<?php
-/**
- * Sidebar template
- *
- * @package {theme_name}
- */
-
-if (!is_active_sidebar('sidebar-1')) {{
-    return;
-}}
-?>
-
-<aside id="secondary" class="widget-area">
-    <?php dynamic_sidebar('sidebar-1'); ?>
-</aside>
-""")
+    files.append((sidebar_php, wordpress_templates.sidebar_php(theme_name)))
 
     # Create template-parts/content.php
     content_php = theme_dir / "template-parts" / "content.php"
-    content_php.write_text(f"""<?php
-/**
- * Template part for displaying posts
- *
- * @package {theme_name}
- */
-?>
-
-<article id="post-<?php the_ID(); ?>" <?php post_class(); ?>>
-    <header class="entry-header">
-        <?php
-        if (is_singular()) :
-            the_title('<h1 class="entry-title">', '</h1>');
-        else :
-            the_title('<h2 class="entry-title"><a href="' . esc_url(get_permalink()) . '">', '</a></h2>');
-        endif;
-        ?>
-    </header>
+    files.append((content_php, wordpress_templates.content_php(theme_name)))
 
-    <?php if (has_post_thumbnail()) : ?>
-    <div class="post-thumbnail">
-        <?php the_post_thumbnail(); ?>
-    </div>
-    <?php endif; ?>
-
-    <div class="entry-content">
-        <?php
-        if (is_singular()) :
-            the_content();
-        else :
-            the_excerpt();
-        endif;
-        ?>
-    </div>
-
-    <footer class="entry-footer">
-        <?php
-        if ('post' === get_post_type()) :
-            ?>
-            <span class="posted-on"><?php echo get_the_date(); ?></span>
-            <span class="byline"><?php the_author_posts_link(); ?></span>
-            <?php
-        endif;
-        ?>
-    </footer>
-</article>
-""")
+    _write_files(files)
 
     console.print(f"[green]✓[/green] WordPress theme '{theme_name}' created:")
     console.print(f"  • {theme_dir}/style.css")
@@ -525,8 +480,205 @@ if (!is_active_sidebar('sidebar-1')) {{
     console.print(f"  3. Use: html2twig convert input.html {theme_dir}/page-custom.php --wordpress")
 
 
+def _write_files(files):
+    """Write ``(path, content)`` pairs as UTF-8 text."""
+    for path, content in files:
+        path.write_text(content, encoding="utf-8")
+
+
+class _UncheckedPath(click.Path):
+    """
+    A click path that is not stat'ed while parsing arguments.
+
+    click.Path stats every value even without exists=True. Batch inputs are
+    opened exactly once by their worker anyway, and a missing or unreadable
+    file is reported there as a failed conversion.
+    """
+
+    def convert(self, value, param, ctx):
+        return value
+
+
+@lru_cache(maxsize=None)
+def _get_converter(wordpress: bool, layout: Optional[str], theme_name: str):
+    """Return the converter for these options, created once per process."""
+    if wordpress:
+        from .wordpress_converter import HTMLToWordPressConverter
+
+        return HTMLToWordPressConverter(theme_name=theme_name)
+
+    from .converter import HTMLToTwigConverter
+
+    return HTMLToTwigConverter(layout=layout)
+
+
+def _report_path(output_path: Union[str, Path]) -> Path:
+    """Return the path of the report written next to an output file."""
+    output = Path(output_path)
+    return output.with_name(output.stem + "_report.txt")
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cached conversion results."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "html2twig"
+
+
+@contextmanager
+def _read_input(input_path: str):
+    """
+    Yield the contents of an input file as a bytes-like object.
+
+    Large files are memory-mapped so their bytes are not copied onto the heap
+    before being hashed and decoded; small files are simply read.
+    """
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+@lru_cache(maxsize=None)
+def _source_fingerprint() -> str:
+    """
+    Hash the converter sources, so editing them invalidates cached results.
+
+    Only the files are read; the converters (and BeautifulSoup) are not imported.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for name in ("converter.py", "wordpress_converter.py", "report.py", "wordpress_templates.py"):
+        try:
+            digest.update((package_dir / name).read_bytes())
+        except OSError:
+            digest.update(name.encode())
+    return digest.hexdigest()
+
+
+def _restore_cached(
+    entry_path: Path, input_path: str, output_path: str, wordpress: bool, generate_report: bool
+):
+    """
+    Write the output (and report) of a cached conversion.
+
+    Raises:
+        OSError, ValueError, KeyError, TypeError or AttributeError when the
+        entry cannot be read or is damaged, incomplete or of another format
+    """
+    entry = json.loads(entry_path.read_text(encoding="utf-8"))
+    report = None
+    if generate_report:
+        # Entries are plain JSON rather than pickles, so a cache directory
+        # written by someone else can at worst yield a wrong template
+        from .report import ConversionReport, WordPressConversionReport
+
+        report_class = WordPressConversionReport if wordpress else ConversionReport
+        report = report_class.from_dict(entry["report"])
+        report.input_file = input_path
+        report.output_file = output_path
+    content = entry["output"]
+    if not isinstance(content, str):
+        raise TypeError("cached output is not a string")
+
+    output = Path(output_path)
+    try:
+        output.write_text(content, encoding="utf-8")
+    except FileNotFoundError:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(content, encoding="utf-8")
+    if report is not None:
+        _report_path(output_path).write_text(report.generate_text(), encoding="utf-8")
+    return report
+
+
+def _cached_convert(
+    input_path: str,
+    output_path: str,
+    key_args: tuple,
+    generate_report: bool = True,
+):
+    """
+    Convert a file, reusing the stored result of an identical earlier conversion.
+
+    Results are keyed on the input bytes, the conversion options, the converter
+    version and sources and the entry format, so any change to one of them
+    triggers a real conversion. A cache that cannot be located or an entry
+    that cannot be read falls back to a real conversion as well.
+
+    Args:
+        input_path: Path to the input HTML file
+        output_path: Path to the output template file
+        key_args: Tuple of (wordpress, layout, theme_name)
+        generate_report: Whether to build and write the report next to the output
+
+    Returns:
+        The conversion report, or None when no report was requested
+    """
+    with _read_input(input_path) as raw:
+        key_hash = hashlib.sha256(raw)
+        key_hash.update(
+            repr((key_args, __version__, _CACHE_FORMAT, _source_fingerprint())).encode()
+        )
+        entry_path: Optional[Path] = None
+        try:
+            # Path.home() raises RuntimeError when no home directory is known
+            entry_path = _cache_dir() / f"{key_hash.hexdigest()}.json"
+            if entry_path.exists():
+                return _restore_cached(
+                    entry_path, input_path, output_path, key_args[0], generate_report
+                )
+        except (RuntimeError, OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Without a cache location, or with a damaged, partial or
+            # report-less entry, the file is converted again
+            pass
+
+        # Reuse the bytes read for hashing instead of reading the file again
+        converter = _get_converter(*key_args)
+        content, report = converter.convert_bytes(
+            raw, output_path, generate_report=generate_report, input_path=input_path
+        )
+
+    # Store the result; a cache that cannot be written is simply skipped
+    if entry_path is None:
+        return report
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_entry = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"output": content, "report": asdict(report) if report is not None else None}
+        tmp_entry.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_entry, entry_path)
+    except OSError:
+        pass
+
+    return report
+
+
+def _convert_one(
+    input_file: str,
+    output_file: str,
+    wordpress: bool,
+    layout: Optional[str],
+    theme_name: str,
+    generate_report: bool = True,
+    use_cache: bool = True,
+):
+    """Convert a single file; also used as the batch worker in a subprocess."""
+    key_args = (wordpress, layout, theme_name)
+    if use_cache:
+        return _cached_convert(input_file, output_file, key_args, generate_report)
+
+    converter = _get_converter(*key_args)
+    with _read_input(input_file) as raw:
+        _, report = converter.convert_bytes(
+            raw, output_file, generate_report=generate_report, input_path=input_file
+        )
+    return report
+
+
 @main.command()
-@click.argument("input_files", nargs=-1, type=click.Path(exists=True))
+@click.argument("input_files", nargs=-1, type=_UncheckedPath())
 @click.option(
     "--output-dir", "-o",
     type=click.Path(),
@@ -550,12 +702,30 @@ if (!is_active_sidebar('sidebar-1')) {{
     default="mytheme",
     help="WordPress theme name"
 )
+@click.option(
+    "--no-report",
+    is_flag=True,
+    help="Don't generate conversion reports"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always reconvert instead of reusing cached output"
+)
+@click.option(
+    "--verbose", "-V",
+    is_flag=True,
+    help="List every converted file"
+)
 def batch(
     input_files: tuple,
     output_dir: str,
     layout: Optional[str],
     wordpress: bool,
     theme_name: str,
+    no_report: bool,
+    no_cache: bool,
+    verbose: bool,
 ):
     """
     Convert multiple HTML files at once.
@@ -572,44 +742,103 @@ def batch(
         sys.exit(1)
 
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    console.print(f"[bold]Converting {len(input_files)} file(s)...[/bold]\n")
-
-    success_count = 0
-    error_count = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for input_file in input_files:
-            input_path = Path(input_file)
-            task = progress.add_task(f"Converting {input_path.name}...", total=None)
-
-            try:
-                # Determine output filename
-                if wordpress:
-                    output_file = output_path / input_path.with_suffix(".php").name
-                    converter = HTMLToWordPressConverter(theme_name=theme_name)
-                else:
-                    output_file = output_path / (input_path.stem + ".html.twig")
-                    converter = HTMLToTwigConverter(layout=layout)
 
-                converter.convert_file(str(input_path), str(output_file))
-
-                progress.update(task, description=f"[green]✓[/green] {input_path.name}")
-                success_count += 1
-
-            except Exception as e:
-                progress.update(task, description=f"[red]✗[/red] {input_path.name}: {str(e)}")
-                error_count += 1
+    # Determine output filenames up front so workers only do the conversion.
+    # A file named more than once (e.g. by overlapping globs) is parsed and
+    # converted only once.
+    suffix = ".php" if wordpress else ".html.twig"
+    input_paths = list(dict.fromkeys(Path(input_file) for input_file in input_files))
+    jobs = []
+    # Errors by input file; an input whose output name is already taken by
+    # an earlier one (e.g. x/index.html and y/index.html) is not converted,
+    # so two workers never write the same file
+    errors: Dict[Path, str] = {}
+    claimed: Dict[Path, Path] = {}
+    for input_path in input_paths:
+        output_file = output_path / (input_path.stem + suffix)
+        if output_file in claimed:
+            errors[input_path] = f"{output_file} is already the output of {claimed[output_file]}"
+            continue
+        claimed[output_file] = input_path
+        jobs.append((input_path, output_file))
+
+    console.print(f"[bold]Converting {len(input_paths)} file(s)...[/bold]\n")
+
+    # Create each distinct output directory once instead of once per file
+    for parent in {output_file.parent for _, output_file in jobs}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    options = {"generate_report": not no_report, "use_cache": not no_cache}
+
+    if len(jobs) == 1:
+        # A single file is converted in this process; a worker pool would
+        # cost more to start than the conversion itself
+        input_path, output_file = jobs[0]
+        try:
+            _convert_one(
+                str(input_path), str(output_file), wordpress, layout, theme_name, **options
+            )
+        except Exception as e:
+            errors[input_path] = str(e)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # All jobs are submitted, and so the workers forked, before the
+            # progress display starts its refresh thread
+            futures = [
+                (
+                    input_path,
+                    executor.submit(
+                        _convert_one,
+                        str(input_path),
+                        str(output_file),
+                        wordpress,
+                        layout,
+                        theme_name,
+                        **options,
+                    ),
+                )
+                for input_path, output_file in jobs
+            ]
+
+            # A single task advanced per file; rendering is skipped entirely
+            # when the output is not a terminal (e.g. piped into a log)
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                MofNCompleteColumn(),
+                console=_rich_console(),
+                disable=not console.is_terminal,
+            ) as progress:
+                task = progress.add_task("Converting...", total=len(jobs))
+                # Results are collected in submission order, so the lists
+                # below follow the input order on every run
+                for input_path, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors[input_path] = str(e)
+                    progress.advance(task)
+
+    # Per-file results are printed after the progress display has finished
+    converted = [input_path.name for input_path in input_paths if input_path not in errors]
+    failed = [
+        (input_path.name, errors[input_path]) for input_path in input_paths if input_path in errors
+    ]
+
+    if verbose:
+        for name in converted:
+            console.print(f"[green]✓[/green] {name}")
+    for name, error in failed:
+        console.print(f"[red]✗[/red] {name}: {error}")
 
     console.print(f"\n[bold]Results:[/bold]")
-    console.print(f"  [green]✓[/green] Converted: {success_count}")
-    if error_count:
-        console.print(f"  [red]✗[/red] Failed: {error_count}")
+    console.print(f"  [green]✓[/green] Converted: {len(converted)}")
+    if failed:
+        console.print(f"  [red]✗[/red] Failed: {len(failed)}")
 
     console.print(f"\n[bold]Output directory:[/bold] {output_path}")
 
@@ -2,112 +2,183 @@
 Core HTML to Twig converter module.
 """
 
+import os
 import re
-from dataclasses import dataclass, field
+from collections import Counter, defaultdict
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Pattern, Set, Tuple, Union, cast
 from bs4 import BeautifulSoup, Tag, NavigableString
 
-
-@dataclass
-class ConversionReport:
-    """Stores all conversions and suggestions made during the conversion process."""
-
-    input_file: str
-    output_file: str
-    layout: Optional[str] = None
-    asset_conversions: list = field(default_factory=list)
-    block_suggestions: list = field(default_factory=list)
-    loop_conversions: list = field(default_factory=list)
-    manual_suggestions: list = field(default_factory=list)
-    warnings: list = field(default_factory=list)
-
-    def add_asset(self, original: str, converted: str, tag_type: str):
-        self.asset_conversions.append(
-            {"original": original, "converted": converted, "type": tag_type}
-        )
-
-    def add_block(self, name: str, reason: str):
-        self.block_suggestions.append({"name": name, "reason": reason})
-
-    def add_loop(self, element: str, items_var: str, item_var: str):
-        self.loop_conversions.append(
-            {"element": element, "items_var": items_var, "item_var": item_var}
-        )
-
-    def add_suggestion(self, suggestion: str):
-        self.manual_suggestions.append(suggestion)
-
-    def add_warning(self, warning: str):
-        self.warnings.append(warning)
-
-    def generate_text(self) -> str:
-        """Generate a text report of all conversions."""
-        lines = [
-            "=" * 70,
-            "HTML TO TWIG CONVERSION REPORT",
-            "=" * 70,
-            "",
-            f"Input:  {self.input_file}",
-            f"Output: {self.output_file}",
-        ]
-
-        if self.layout:
-            lines.append(f"Layout: {self.layout}")
-
-        lines.extend(["", "-" * 70, "ASSET CONVERSIONS", "-" * 70])
-
-        if self.asset_conversions:
-            for conv in self.asset_conversions:
-                lines.append(f"  [{conv['type'].upper()}]")
-                lines.append(f"    Before: {conv['original']}")
-                lines.append(f"    After:  {conv['converted']}")
-                lines.append("")
+from .report import (
+    AssetConversion,
+    BlockSuggestion,
+    ConversionReport,
+    LoopConversion,
+    _NullConversionReport,
+)
+
+
+# URL prefixes of references that are left untouched: remote URLs (and
+# references that name no file, such as #fragments and mailto: links),
+# inline data and values that are already Twig expressions
+_REMOTE_PREFIXES = ("http://", "https://", "//", "#", "mailto:", "tel:", "javascript:")
+_EXTERNAL_PREFIXES = _REMOTE_PREFIXES + ("data:", "{{")
+_REMOTE_OR_TWIG_PREFIXES = _REMOTE_PREFIXES + ("{{",)
+_REMOTE_OR_DATA_PREFIXES = _REMOTE_PREFIXES + ("data:",)
+
+
+def _is_stylesheet(link: Tag) -> bool:
+    return "stylesheet" in link.attrs.get("rel", ())
+
+
+def _is_icon(link: Tag) -> bool:
+    return any("icon" in rel.lower() for rel in link.attrs.get("rel", ()))
+
+
+# Attribute references converted to asset() calls, in report order:
+# (tag name, attribute, default asset type, report type, prefixes left
+# untouched, element filter or None)
+_ASSET_RULES = (
+    ("img", "src", "images", "img", _EXTERNAL_PREFIXES, None),
+    ("link", "href", "css", "css", _REMOTE_OR_TWIG_PREFIXES, _is_stylesheet),
+    ("script", "src", "js", "js", _REMOTE_OR_TWIG_PREFIXES, None),
+    ("link", "href", "images", "favicon", _REMOTE_OR_TWIG_PREFIXES, _is_icon),
+    ("source", "src", "images", "source", _REMOTE_OR_TWIG_PREFIXES, None),
+    ("video", "poster", "images", "video-poster", _REMOTE_OR_TWIG_PREFIXES, None),
+)
+
+# Asset type for files whose path does not match ASSET_PATTERNS
+_EXTENSION_TYPES = {
+    **dict.fromkeys([".css", ".scss", ".sass", ".less"], "css"),
+    **dict.fromkeys([".js", ".mjs", ".ts"], "js"),
+    **dict.fromkeys([".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".avif"], "images"),
+    **dict.fromkeys([".woff", ".woff2", ".ttf", ".otf", ".eot"], "fonts"),
+}
+
+# Patterns used by the conversion steps, compiled once
+_IMPORT_RE = re.compile(r'@import\s+url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
+_URL_RE = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
+_DOTDOT_RE = re.compile(r"^(?:\.\.?/)+")
+_TWIG_TAG_RE = re.compile(r"(\{%[^%]+%\})")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SRCSET_CANDIDATE_RE = re.compile(r"([^\s,]+)([^,]*)")
+
+# Escaped Twig delimiters in the serialised output. Replacing "&lt;%", "%&gt;",
+# "&lt;{" and "}&gt;" one after the other lets an earlier replacement complete
+# a later one (e.g. "&lt;&lt;%" -> "&lt;{%" -> "{{%"), so the pattern also
+# covers those combined forms to give the same result in a single pass.
+_ESCAPED_TWIG = {
+    "&lt;%": "{%",
+    "&lt;%&gt;": "{%}",
+    "&lt;%&gt;&gt;": "{%}}",
+    "&lt;&lt;%": "{{%",
+    "&lt;&lt;%&gt;": "{{%}",
+    "&lt;&lt;%&gt;&gt;": "{{%}}",
+    "%&gt;": "%}",
+    "%&gt;&gt;": "%}}",
+    "&lt;{": "{{",
+    "}&gt;": "}}",
+}
+_ESCAPED_TWIG_RE = re.compile(r"(?:&lt;)?&lt;%(?:&gt;(?:&gt;)?)?|%&gt;(?:&gt;)?|&lt;\{|\}&gt;")
+
+
+def _unescape_twig(match) -> str:
+    """Return the Twig delimiters for an _ESCAPED_TWIG_RE match."""
+    return _ESCAPED_TWIG[match.group(0)]
+
+
+class _TwigString(NavigableString):
+    """A Twig tag inserted into the tree; serialized as-is, without entity escaping."""
+
+    def output_ready(self, formatter="minimal") -> str:
+        return self.PREFIX + self + self.SUFFIX
+
+
+_CONTENT_CLASS_RE = re.compile(r"content|main", re.IGNORECASE)
+
+# The simple selectors used in NAV_SELECTORS and BLOCK_PATTERNS:
+# tag, tag.class, .class, #id and [role='value']
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"^(?P<name>\w+)?(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[role='(?P<role>[\w-]+)'\])?$"
+)
+
+
+def _extension_type(path: str) -> Optional[str]:
+    """Return the asset directory for the extension of path, or None if it is not known."""
+    # Follows Path.suffix without building a Path for ordinary names
+    name = path.rpartition("/")[2]
+    if name in ("", "."):
+        name = Path(path).name
+    dot = name.rfind(".")
+    return _EXTENSION_TYPES.get(name[dot:].lower()) if dot > 0 else None
+
+
+def _index_selectors(selectors) -> tuple[set, dict]:
+    """
+    Index simple selectors so they can be matched during a single tree walk.
+
+    Returns:
+        Tuple of (tag names matched by bare tag selectors, dict mapping
+        ("class" | "id" | "role", value) to (required tag name or None, selector))
+    """
+    names: Set[str] = set()
+    index: Dict[Tuple[str, str], List[Tuple[Optional[str], str]]] = {}
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR_RE.match(selector)
+        if not match:
+            raise ValueError(f"Unsupported selector: {selector!r}")
+        name, cls, id_, role = match.group("name", "cls", "id", "role")
+        if cls:
+            key = ("class", cls)
+        elif id_:
+            key = ("id", id_)
+        elif role:
+            key = ("role", role)
         else:
-            lines.append("  No asset conversions performed.")
-            lines.append("")
+            names.add(name)
+            continue
+        index.setdefault(key, []).append((name, selector))
+    return names, index
 
-        lines.extend(["-" * 70, "BLOCK SUGGESTIONS", "-" * 70])
 
-        if self.block_suggestions:
-            for block in self.block_suggestions:
-                lines.append(f"  {{% block {block['name']} %}}")
-                lines.append(f"    Reason: {block['reason']}")
-                lines.append("")
-        else:
-            lines.append("  No block suggestions.")
-            lines.append("")
+def _combine_patterns(patterns: dict) -> tuple[re.Pattern, dict]:
+    """
+    Combine anchored patterns into one alternation tried in the same order.
 
-        lines.extend(["-" * 70, "LOOP CONVERSIONS", "-" * 70])
+    Returns:
+        Tuple of (combined pattern, dict mapping the index of each
+        alternative's group to its key); a pattern's first group follows
+        its alternative's group
+    """
+    alternatives = []
+    keys = {}
+    group = 1
+    for key, pattern in patterns.items():
+        flags = "i" if pattern.flags & re.IGNORECASE else "-i"
+        alternatives.append(f"((?{flags}:{pattern.pattern}))")
+        keys[group] = key
+        group += pattern.groups + 1
+    return re.compile("|".join(alternatives)), keys
 
-        if self.loop_conversions:
-            for loop in self.loop_conversions:
-                lines.append(f"  Element: {loop['element']}")
-                lines.append(f"    {{% for {loop['item_var']} in {loop['items_var']} %}}")
-                lines.append("")
-        else:
-            lines.append("  No loop conversions performed.")
-            lines.append("")
 
-        lines.extend(["-" * 70, "MANUAL REVIEW SUGGESTIONS", "-" * 70])
+# Converter of a convert_files worker process, built once by _init_worker
+_worker_converter: Optional["HTMLToTwigConverter"] = None
 
-        if self.manual_suggestions:
-            for i, suggestion in enumerate(self.manual_suggestions, 1):
-                lines.append(f"  {i}. {suggestion}")
-            lines.append("")
-        else:
-            lines.append("  No manual review needed.")
-            lines.append("")
 
-        if self.warnings:
-            lines.extend(["-" * 70, "WARNINGS", "-" * 70])
-            for warning in self.warnings:
-                lines.append(f"  ⚠ {warning}")
-            lines.append("")
+def _init_worker(converter_class: type, layout: Optional[str], parser: str):
+    """Build the converter that a worker process reuses for all its jobs."""
+    global _worker_converter
+    _worker_converter = converter_class(layout=layout, parser=parser)
 
-        lines.extend(["=" * 70, "END OF REPORT", "=" * 70])
 
-        return "\n".join(lines)
+def _convert_one(args: tuple) -> tuple[str, Optional[ConversionReport]]:
+    """Convert one ``(input, output, generate_report)`` job in a worker process."""
+    input_path, output_path, generate_report = args
+    converter = _worker_converter
+    assert converter is not None, "_init_worker has not run in this process"
+    return converter.convert_file(input_path, output_path, generate_report=generate_report)
 
 
 class HTMLToTwigConverter:
@@ -135,16 +206,66 @@ class HTMLToTwigConverter:
         "javascripts": ["body"],
     }
 
-    def __init__(self, layout: Optional[str] = None):
+    # Tags collected for the asset steps
+    COLLECTED_TAGS = {"img", "link", "style", "script", "source", "video"}
+
+    # Containers checked for repeated children
+    CONTAINER_TAGS = {"div", "section", "article"}
+
+    # Built from the tables above by _index_selector_tables
+    _selector_index: Dict[Tuple[str, str], List[Tuple[Optional[str], str]]]
+    _collected_tags: Set[str]
+    _asset_re: Pattern[str]
+    _asset_types: Dict[int, str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override the selector or tag tables
+        cls._index_selector_tables()
+
+    @classmethod
+    def _index_selector_tables(cls):
+        """Index NAV_SELECTORS, BLOCK_PATTERNS and ASSET_PATTERNS once per class."""
+        selector_names, cls._selector_index = _index_selectors(
+            cls.NAV_SELECTORS
+            + [selector for selectors in cls.BLOCK_PATTERNS.values() for selector in selectors]
+        )
+        cls._collected_tags = cls.COLLECTED_TAGS | selector_names
+        cls._asset_re, cls._asset_types = _combine_patterns(cls.ASSET_PATTERNS)
+
+    def __init__(self, layout: Optional[str] = None, parser: str = "lxml"):
         """
         Initialize the converter.
 
         Args:
             layout: Name of the base layout to extend (e.g., 'base' for base.html.twig)
+            parser: BeautifulSoup tree builder used to parse the HTML (e.g.,
+                'html5lib' for badly broken markup)
         """
         self.layout = layout
+        self.parser = parser
+        # The extends tag only depends on the layout, so it is formatted once
+        self._extends_line = f"{{% extends '{layout}.html.twig' %}}\n" if layout else ""
         self.report: Optional[ConversionReport] = None
         self.soup: Optional[BeautifulSoup] = None
+        self._asset_path_cache = lru_cache(maxsize=4096)(self._resolve_asset_path)
+
+    def reset(
+        self, input_path: str = "", output_path: str = "", generate_report: bool = True
+    ):
+        """
+        Clear per-file state so the converter can be reused for another file.
+
+        Args:
+            input_path: Path of the next input file (recorded in the report)
+            output_path: Path of the next output file (recorded in the report)
+            generate_report: Whether the next conversion should record a report
+        """
+        report_class = ConversionReport if generate_report else _NullConversionReport
+        self.report = report_class(
+            input_file=input_path, output_file=output_path, layout=self.layout
+        )
+        self.soup = None
 
     def convert_file(
         self, input_path: str, output_path: str, generate_report: bool = True
@@ -159,145 +280,223 @@ class HTMLToTwigConverter:
         Returns:
             Tuple of (converted content, report)
         """
-        with open(input_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        self.report = ConversionReport(
-            input_file=input_path, output_file=output_path, layout=self.layout
+        return self.convert_bytes(
+            Path(input_path).read_bytes(),
+            output_path,
+            generate_report=generate_report,
+            input_path=input_path,
         )
 
-        twig_content = self.convert(html_content)
+    def convert_files(
+        self,
+        pairs: list[tuple[str, str]],
+        workers: Optional[int] = None,
+        generate_report: bool = True,
+    ) -> list[tuple[str, Optional[ConversionReport]]]:
+        """
+        Convert several HTML files in parallel worker processes.
+
+        Args:
+            pairs: ``(input_path, output_path)`` pairs to convert
+            workers: Number of worker processes (defaults to the CPU count)
+            generate_report: Whether to build and write a report for each file
+
+        Returns:
+            List of (converted content, report or None), in the order of ``pairs``
+        """
+        if not pairs:
+            return []
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each worker builds one converter of this class, layout and parser
+        # and reuses it (and its asset path cache) for all of its jobs, so
+        # neither the soup nor the caches of this instance are pickled
+        workers = min(workers or os.cpu_count() or 1, len(pairs))
+        jobs = [
+            (str(input_path), str(output_path), generate_report)
+            for input_path, output_path in pairs
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(type(self), self.layout, self.parser),
+        ) as executor:
+            return list(
+                executor.map(_convert_one, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+            )
+
+    def convert_bytes(
+        self,
+        raw: bytes,
+        output_path: str,
+        generate_report: bool = True,
+        input_path: str = "",
+    ) -> tuple[str, Optional[ConversionReport]]:
+        """
+        Convert already-read HTML bytes and save the result to a file.
+
+        Args:
+            raw: UTF-8 encoded HTML content (bytes or another buffer, e.g. an mmap)
+            output_path: Path to the output Twig file
+            generate_report: Whether to build and write the conversion report
+            input_path: Original input path, recorded in the report
+
+        Returns:
+            Tuple of (converted content, report or None)
+        """
+        html_content = str(raw, "utf-8")
+
+        self.reset(input_path, output_path, generate_report)
+
+        twig_content = self._convert(html_content)
 
         # Save output
+        # The output directory usually exists already, so it is only
+        # created when writing the file fails
         output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(twig_content)
+        try:
+            output.write_text(twig_content, encoding="utf-8")
+        except FileNotFoundError:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(twig_content, encoding="utf-8")
 
         # Generate report
         if generate_report:
-            report_path = str(output_path).rsplit(".", 1)[0] + "_report.txt"
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(self.report.generate_text())
+            report = self.report
+            assert report is not None
+            report_path = output.with_name(output.stem + "_report.txt")
+            report_path.write_text(report.generate_text(), encoding="utf-8")
+            return twig_content, report
 
-        return twig_content, self.report
+        return twig_content, None
 
-    def convert(self, html_content: str) -> str:
+    def convert(self, html_content: Union[str, bytes]) -> str:
         """
         Convert HTML content to Twig.
 
         Args:
-            html_content: The HTML content to convert
+            html_content: The HTML content to convert; bytes are handed to
+                the parser as-is and decoded using the document's declared
+                or detected encoding
 
         Returns:
             Converted Twig template content
         """
-        self.soup = BeautifulSoup(html_content, "lxml")
+        self.reset()
+        return self._convert(html_content)
+
+    def _convert(self, html_content: Union[str, bytes]) -> str:
+        """Run the conversion pipeline, recording into the current report."""
+        self.soup = BeautifulSoup(html_content, self.parser)
+
+        # Walk the tree once; the steps below work on the collected elements
+        found = self._collect_elements()
 
         # Convert assets
-        self._convert_images()
-        self._convert_stylesheets()
-        self._convert_scripts()
-        self._convert_other_assets()
+        self._convert_assets(found)
 
         # Detect and convert navigation menus
-        self._convert_navigation()
+        self._convert_navigation(found)
 
         # Detect repetitive patterns
-        self._detect_blocks()
+        self._detect_blocks(found)
 
         # Detect other repetitive elements
-        self._detect_repetitive_elements()
+        self._detect_repetitive_elements(found["[container]"])
 
         # Generate Twig output
         twig_content = self._generate_twig_output()
 
         return twig_content
 
-    def _convert_images(self):
-        """Convert image src attributes to Twig asset() calls."""
-        for img in self.soup.find_all("img"):
-            src = img.get("src", "")
-            if src and not src.startswith(("http://", "https://", "//", "data:", "{{")):
-                new_src = self._convert_asset_path(src, "images")
-                if new_src != src:
-                    self.report.add_asset(src, new_src, "img")
-                    img["src"] = new_src
-
-            # Also handle srcset
-            srcset = img.get("srcset", "")
+    def _collect_elements(self) -> defaultdict:
+        """
+        Walk the parsed tree once and group the elements the conversion steps use.
+
+        Returns:
+            Dict mapping each tag name in COLLECTED_TAGS, each selector in
+            NAV_SELECTORS and BLOCK_PATTERNS, "[container]" (CONTAINER_TAGS)
+            and "[style]" (elements with an inline style) to the matching
+            elements in document order
+        """
+        found = defaultdict(list)
+        collected_tags = self._collected_tags
+        container_tags = self.CONTAINER_TAGS
+        selector_index = self._selector_index
+        soup = self.soup
+        assert soup is not None
+
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            name = tag.name
+            attrs = tag.attrs
+            if name in collected_tags:
+                found[name].append(tag)
+            if name in container_tags:
+                found["[container]"].append(tag)
+            if "style" in attrs:
+                found["[style]"].append(tag)
+
+            keys = [("class", cls) for cls in attrs.get("class", ())]
+            # Only class is a multi-valued attribute; id and role are strings
+            if "id" in attrs:
+                keys.append(("id", cast(str, attrs["id"])))
+            if "role" in attrs:
+                keys.append(("role", cast(str, attrs["role"])))
+            for key in keys:
+                for required_name, selector in selector_index.get(key, ()):
+                    if required_name is None or required_name == name:
+                        matches = found[selector]
+                        # A repeated class must not list the element twice
+                        if not matches or matches[-1] is not tag:
+                            matches.append(tag)
+
+        return found
+
+    def _convert_assets(self, found: dict):
+        """Convert asset references to Twig asset() calls."""
+        report = self.report
+        assert report is not None
+        for tag_name, attr, asset_type, report_type, skip_prefixes, accepts in _ASSET_RULES:
+            for elem in found[tag_name]:
+                if accepts is not None and not accepts(elem):
+                    continue
+                # The attribute dict is used directly rather than through
+                # Tag.get and Tag.__setitem__
+                attrs = elem.attrs
+                value = attrs.get(attr, "")
+                if value and not value.startswith(skip_prefixes):
+                    new_value = self._convert_asset_path(value, asset_type)
+                    if new_value != value:
+                        report.add_asset(value, new_value, report_type)
+                        attrs[attr] = new_value
+
+        # Responsive images (img and picture/video sources)
+        for elem in found["img"] + found["source"]:
+            attrs = elem.attrs
+            srcset = attrs.get("srcset", "")
             if srcset and not srcset.startswith("{{"):
                 new_srcset = self._convert_srcset(srcset)
                 if new_srcset != srcset:
-                    img["srcset"] = new_srcset
-
-    def _convert_stylesheets(self):
-        """Convert stylesheet href attributes to Twig asset() calls."""
-        for link in self.soup.find_all("link", rel="stylesheet"):
-            href = link.get("href", "")
-            if href and not href.startswith(("http://", "https://", "//", "{{")):
-                new_href = self._convert_asset_path(href, "css")
-                if new_href != href:
-                    self.report.add_asset(href, new_href, "css")
-                    link["href"] = new_href
-
-        # Also handle <style> with @import
-        for style in self.soup.find_all("style"):
-            if style.string:
-                new_content = self._convert_css_imports(style.string)
-                if new_content != style.string:
+                    attrs["srcset"] = new_srcset
+
+        # <style> with @import
+        for style in found["style"]:
+            content = style.string
+            if content:
+                new_content = self._convert_css_imports(content)
+                if new_content != content:
                     style.string = new_content
 
-    def _convert_scripts(self):
-        """Convert script src attributes to Twig asset() calls."""
-        for script in self.soup.find_all("script", src=True):
-            src = script.get("src", "")
-            if src and not src.startswith(("http://", "https://", "//", "{{")):
-                new_src = self._convert_asset_path(src, "js")
-                if new_src != src:
-                    self.report.add_asset(src, new_src, "js")
-                    script["src"] = new_src
-
-    def _convert_other_assets(self):
-        """Convert other asset references (fonts, favicons, etc.)."""
-        # Favicons and icons
-        for link in self.soup.find_all("link", rel=lambda x: x and "icon" in x.lower()):
-            href = link.get("href", "")
-            if href and not href.startswith(("http://", "https://", "//", "{{")):
-                new_href = self._convert_asset_path(href, "images")
-                if new_href != href:
-                    self.report.add_asset(href, new_href, "favicon")
-                    link["href"] = new_href
-
         # Background images in inline styles
-        for elem in self.soup.find_all(style=True):
-            style = elem["style"]
+        for elem in found["[style]"]:
+            attrs = elem.attrs
+            style = attrs["style"]
             new_style = self._convert_inline_style_urls(style)
             if new_style != style:
-                elem["style"] = new_style
-
-        # Source elements (for picture, video, audio)
-        for source in self.soup.find_all("source"):
-            src = source.get("src", "")
-            srcset = source.get("srcset", "")
-            if src and not src.startswith(("http://", "https://", "//", "{{")):
-                new_src = self._convert_asset_path(src, "images")
-                if new_src != src:
-                    self.report.add_asset(src, new_src, "source")
-                    source["src"] = new_src
-            if srcset and not srcset.startswith("{{"):
-                new_srcset = self._convert_srcset(srcset)
-                if new_srcset != srcset:
-                    source["srcset"] = new_srcset
-
-        # Video poster attributes
-        for video in self.soup.find_all("video"):
-            poster = video.get("poster", "")
-            if poster and not poster.startswith(("http://", "https://", "//", "{{")):
-                new_poster = self._convert_asset_path(poster, "images")
-                if new_poster != poster:
-                    self.report.add_asset(poster, new_poster, "video-poster")
-                    video["poster"] = new_poster
+                attrs["style"] = new_style
 
     def _convert_asset_path(self, path: str, default_type: str = "images") -> str:
         """
@@ -310,76 +509,67 @@ class HTMLToTwigConverter:
         Returns:
             Twig asset() expression or original path if external
         """
-        if not path or path.startswith(("http://", "https://", "//", "data:", "{{")):
+        if not path or path.startswith(_EXTERNAL_PREFIXES):
             return path
 
+        # The result depends only on the path, and pages repeat the same
+        # assets many times, so lookups are memoised per converter
+        return self._asset_path_cache(path)
+
+    def _resolve_asset_path(self, path: str) -> str:
+        """Compute the asset() expression for a local asset path."""
         # Clean the path
         clean_path = path.strip()
 
-        # Try to match against known patterns
-        for asset_type, pattern in self.ASSET_PATTERNS.items():
-            match = pattern.match(clean_path)
-            if match:
-                filename = match.group(1)
-                return f"{{{{ asset('{asset_type}/{filename}') }}}}"
+        # Try to match against known patterns, all in one match call
+        match = self._asset_re.match(clean_path)
+        if match:
+            # The matched alternative's group is the last one to close
+            group = match.lastindex
+            assert group is not None
+            asset_type = self._asset_types[group]
+            filename = match.group(group + 1)
+            return f"{{{{ asset('{asset_type}/{filename}') }}}}"
 
         # Fallback: use the path as-is with default type
         # Remove leading ./ or ../
-        clean_path = re.sub(r"^(?:\.\.?/)+", "", clean_path)
+        clean_path = _DOTDOT_RE.sub("", clean_path)
 
         # Determine asset type from extension
-        ext = Path(clean_path).suffix.lower()
-        if ext in [".css", ".scss", ".sass", ".less"]:
-            return f"{{{{ asset('css/{clean_path}') }}}}"
-        elif ext in [".js", ".mjs", ".ts"]:
-            return f"{{{{ asset('js/{clean_path}') }}}}"
-        elif ext in [".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".avif"]:
-            return f"{{{{ asset('images/{clean_path}') }}}}"
-        elif ext in [".woff", ".woff2", ".ttf", ".otf", ".eot"]:
-            return f"{{{{ asset('fonts/{clean_path}') }}}}"
-        else:
-            return f"{{{{ asset('{clean_path}') }}}}"
+        extension_type = _extension_type(clean_path)
+        if extension_type:
+            return f"{{{{ asset('{extension_type}/{clean_path}') }}}}"
+        return f"{{{{ asset('{clean_path}') }}}}"
 
     def _convert_srcset(self, srcset: str) -> str:
         """Convert srcset attribute values to Twig asset() calls."""
-        parts = srcset.split(",")
         new_parts = []
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            # Split into URL and descriptor
-            tokens = part.split()
-            if tokens:
-                url = tokens[0]
-                descriptor = " ".join(tokens[1:]) if len(tokens) > 1 else ""
-                new_url = self._convert_asset_path(url, "images")
-                if descriptor:
-                    new_parts.append(f"{new_url} {descriptor}")
-                else:
-                    new_parts.append(new_url)
+        # Each candidate is a URL followed by an optional descriptor
+        for match in _SRCSET_CANDIDATE_RE.finditer(srcset):
+            new_url = self._convert_asset_path(match.group(1), "images")
+            descriptor = " ".join(match.group(2).split())
+            if descriptor:
+                new_parts.append(f"{new_url} {descriptor}")
+            else:
+                new_parts.append(new_url)
         return ", ".join(new_parts)
 
     def _convert_css_imports(self, css_content: str) -> str:
         """Convert @import url() in CSS to Twig asset() calls."""
-        import_pattern = re.compile(r'@import\s+url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
-
         def replace_import(match):
             url = match.group(1)
-            if url.startswith(("http://", "https://", "//")):
+            if url.startswith(_REMOTE_PREFIXES):
                 return match.group(0)
             new_url = self._convert_asset_path(url, "css")
             return f"@import url('{new_url}')"
 
-        return import_pattern.sub(replace_import, css_content)
+        return _IMPORT_RE.sub(replace_import, css_content)
 
     def _convert_inline_style_urls(self, style: str) -> str:
         """Convert url() in inline styles to Twig asset() calls."""
-        url_pattern = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
-
         def replace_url(match):
             url = match.group(1)
-            if url.startswith(("http://", "https://", "//", "data:")):
+            if url.startswith(_REMOTE_OR_DATA_PREFIXES):
                 return match.group(0)
             new_url = self._convert_asset_path(url, "images")
             # Remove the outer {{ }} for use inside url()
@@ -388,42 +578,56 @@ class HTMLToTwigConverter:
                 return f"url('{inner}')"
             return f"url('{new_url}')"
 
-        return url_pattern.sub(replace_url, style)
+        return _URL_RE.sub(replace_url, style)
 
-    def _convert_navigation(self):
+    def _convert_navigation(self, found: dict):
         """Detect and convert navigation menus to Twig for loops."""
+        # An element matched by several selectors (e.g. "nav" and
+        # ".navigation"), or a list already rewritten through its <nav>, is
+        # only converted once
+        seen = set()
         for selector in self.NAV_SELECTORS:
-            navs = self.soup.select(selector)
-            for nav in navs:
-                self._convert_nav_element(nav)
-
-    def _convert_nav_element(self, nav: Tag):
-        """Convert a navigation element to use Twig for loops."""
-        # Find the list items
-        items = nav.find_all("li", recursive=True)
+            for nav in found.get(selector, ()):
+                # Skip menus removed while converting an earlier one
+                if id(nav) in seen or nav.decomposed:
+                    continue
+                seen.add(id(nav))
+                converted_ul = self._convert_nav_element(nav)
+                if converted_ul is not None:
+                    seen.add(id(converted_ul))
+
+    def _convert_nav_element(self, nav: Tag) -> Optional[Tag]:
+        """
+        Convert a navigation element to use Twig for loops.
+
+        Returns:
+            The list whose items were wrapped in a loop, or None
+        """
+        # Find the top-level list items; items of nested sub-menus are
+        # part of their parent item
+        parent_ul = nav.find("ul") if nav.name != "ul" else nav
+        if not parent_ul:
+            return None
+        items = parent_ul.find_all("li", recursive=False)
         if len(items) < 2:
-            return
+            return None
 
         # Check if items have similar structure (likely a menu)
         first_item = items[0]
-        similar_count = 0
-        for item in items[1:]:
-            if self._elements_similar(first_item, item):
-                similar_count += 1
+        similar_count = self._count_similar(first_item, items[1:])
 
         # If more than half are similar, suggest a loop
         if similar_count >= len(items) // 2:
-            # Find the parent ul
-            parent_ul = nav.find("ul") if nav.name != "ul" else nav
-            if parent_ul:
-                menu_name = self._detect_menu_name(nav)
-                self._wrap_nav_items(parent_ul, items, menu_name)
-                self.report.add_loop(
-                    f"<nav> / <ul> menu", f"{menu_name}_items", "item"
-                )
-                self.report.add_suggestion(
-                    f"Review the '{menu_name}' navigation loop and adjust variable names as needed."
-                )
+            menu_name = self._detect_menu_name(nav)
+            self._wrap_nav_items(parent_ul, items, menu_name)
+            report = self.report
+            assert report is not None
+            report.add_loop(f"<nav> / <ul> menu", f"{menu_name}_items", "item")
+            report.add_suggestion(
+                f"Review the '{menu_name}' navigation loop and adjust variable names as needed."
+            )
+            return parent_ul
+        return None
 
     def _detect_menu_name(self, nav: Tag) -> str:
         """Detect a suitable name for the navigation menu."""
@@ -439,14 +643,21 @@ class HTMLToTwigConverter:
             return nav["aria-label"].lower().replace(" ", "_").replace("-", "_")
         return "menu"
 
-    def _elements_similar(self, elem1: Tag, elem2: Tag) -> bool:
-        """Check if two elements have similar structure."""
-        if elem1.name != elem2.name:
-            return False
-        # Check if they have similar child structure
-        children1 = [c.name for c in elem1.children if isinstance(c, Tag)]
-        children2 = [c.name for c in elem2.children if isinstance(c, Tag)]
-        return children1 == children2
+    def _count_similar(self, first: Tag, others: list) -> int:
+        """Count the elements in others with the same structure as first."""
+        # The reference structure is computed once, and each other element's
+        # children are only listed when its own name matches
+        name = first.name
+        child_names = self._child_names(first)
+        return sum(
+            1 for elem in others
+            if elem.name == name and self._child_names(elem) == child_names
+        )
+
+    @staticmethod
+    def _child_names(elem: Tag) -> tuple:
+        """Return the names of an element's child tags."""
+        return tuple(c.name for c in elem.children if isinstance(c, Tag))
 
     def _wrap_nav_items(self, parent_ul: Tag, items: list, menu_name: str):
         """Wrap navigation items in a Twig for loop."""
@@ -459,10 +670,6 @@ class HTMLToTwigConverter:
         # Build the loop item template
         link = first_item.find("a")
         if link:
-            # Create Twig variable placeholders
-            original_href = link.get("href", "#")
-            original_text = link.get_text(strip=True)
-
             # Replace with Twig variables
             link["href"] = "{{ item.url }}"
 
@@ -485,8 +692,8 @@ class HTMLToTwigConverter:
             first_item["class"] = "{{ item.active ? 'active' : '' }}"
 
         # Create the for loop wrapper
-        loop_start = self.soup.new_string(f"{{% for item in {menu_name}_items %}}\n")
-        loop_end = self.soup.new_string("\n{% endfor %}")
+        loop_start = _TwigString(f"{{% for item in {menu_name}_items %}}\n")
+        loop_end = _TwigString("\n{% endfor %}")
 
         # Insert loop markers
         first_item.insert_before(loop_start)
@@ -497,82 +704,75 @@ class HTMLToTwigConverter:
 
         first_item.insert_after(loop_end)
 
-    def _detect_blocks(self):
+    def _detect_blocks(self, found: dict):
         """Detect common block patterns and suggest Twig blocks."""
+        report = self.report
+        assert report is not None
         for block_name, selectors in self.BLOCK_PATTERNS.items():
             for selector in selectors:
-                try:
-                    elements = self.soup.select(selector)
-                    if elements:
-                        self.report.add_block(
-                            block_name, f"Detected {selector} element(s)"
-                        )
-                        break
-                except Exception:
-                    continue
+                # Elements removed by the navigation step no longer count
+                if any(not element.decomposed for element in found.get(selector, ())):
+                    report.add_block(block_name, f"Detected {selector} element(s)")
+                    break
 
-    def _detect_repetitive_elements(self):
+    def _detect_repetitive_elements(self, containers: list):
         """Detect repetitive patterns that might need loops."""
+        report = self.report
+        assert report is not None
         # Look for repeated similar elements (cards, list items, etc.)
-        containers = self.soup.find_all(["div", "section", "article"])
-
         for container in containers:
+            if container.decomposed:
+                continue
             children = [c for c in container.children if isinstance(c, Tag)]
             if len(children) < 3:
                 continue
 
-            # Check for similar children
-            first_child = children[0]
-            similar_count = sum(
-                1 for c in children[1:] if self._elements_similar(first_child, c)
-            )
+            # Bucket the children by structure in one pass; the largest
+            # bucket is the repeated element, wherever it starts
+            signatures = Counter((c.name, self._child_names(c)) for c in children)
+            similar_count = signatures.most_common(1)[0][1]
 
-            if similar_count >= 2:
+            if similar_count >= 3:
                 container_id = container.get("id", container.get("class", ["container"])[0] if container.get("class") else "container")
-                self.report.add_suggestion(
+                report.add_suggestion(
                     f"Consider using a for loop for repeated elements in '{container_id}' "
-                    f"({similar_count + 1} similar children found)"
+                    f"({similar_count} similar children found)"
                 )
 
     def _generate_twig_output(self) -> str:
         """Generate the final Twig template output."""
-        # Get the HTML output
-        html_output = str(self.soup)
-
-        # Clean up the output
-        html_output = self._cleanup_html_output(html_output)
-
-        # Add extends and blocks if layout is specified
+        # Add extends and blocks if layout is specified; the parts are taken
+        # from the converted tree directly rather than from a re-parse
+        soup = self.soup
+        assert soup is not None
         if self.layout:
-            html_output = self._add_layout_structure(html_output)
+            return self._add_layout_structure(soup)
 
-        return html_output
+        # Get the HTML output and clean it up
+        return self._cleanup_html_output(str(soup))
 
     def _cleanup_html_output(self, html: str) -> str:
         """Clean up the HTML output for better Twig formatting."""
-        # Fix double-escaped Twig syntax
-        html = html.replace("&lt;%", "{%")
-        html = html.replace("%&gt;", "%}")
-        html = html.replace("&lt;{", "{{")
-        html = html.replace("}&gt;", "}}")
+        # Fix double-escaped Twig syntax in one pass
+        html = _ESCAPED_TWIG_RE.sub(_unescape_twig, html)
 
         # Ensure proper newlines around Twig tags
-        html = re.sub(r"(\{%[^%]+%\})", r"\n\1\n", html)
-        html = re.sub(r"\n{3,}", "\n\n", html)
+        html = _TWIG_TAG_RE.sub(r"\n\1\n", html)
+        html = _BLANK_LINES_RE.sub("\n\n", html)
 
         return html
 
-    def _add_layout_structure(self, html: str) -> str:
+    def _add_layout_structure(self, soup: BeautifulSoup) -> str:
         """Add Twig extends and block structure for layout inheritance."""
-        # Parse the HTML to extract parts
-        soup = BeautifulSoup(html, "lxml")
+        cleanup = self._cleanup_html_output
 
-        lines = [f"{{% extends '{self.layout}.html.twig' %}}\n"]
+        lines = [self._extends_line]
 
         # Extract title
         title = soup.find("title")
         if title:
-            title_text = title.get_text(strip=True)
+            # Clean up the serialised text, as for the other parts
+            title_text = unescape(cleanup(title.decode_contents())).strip()
             lines.append(f"{{% block title %}}{title_text}{{% endblock %}}\n")
 
         # Extract head content (stylesheets, meta)
@@ -583,11 +783,11 @@ class HTMLToTwigConverter:
             for child in head.children:
                 if isinstance(child, Tag):
                     if child.name == "link" and child.get("rel") == ["stylesheet"]:
-                        stylesheets.append(str(child))
+                        stylesheets.append(cleanup(str(child)))
                     elif child.name == "meta" and child.get("name"):
-                        metas.append(str(child))
+                        metas.append(cleanup(str(child)))
                     elif child.name == "style":
-                        stylesheets.append(str(child))
+                        stylesheets.append(cleanup(str(child)))
 
             if stylesheets:
                 lines.append("\n{% block stylesheets %}")
@@ -600,16 +800,16 @@ class HTMLToTwigConverter:
         if body:
             # Try to detect main content areas
             main_content = body.find(["main", "article"]) or body.find(
-                class_=re.compile(r"content|main", re.IGNORECASE)
+                class_=_CONTENT_CLASS_RE
             )
 
             if main_content:
                 lines.append("\n{% block body %}")
-                lines.append(str(main_content))
+                lines.append(cleanup(str(main_content)))
                 lines.append("{% endblock %}\n")
             else:
                 # Use entire body
-                body_content = "".join(str(c) for c in body.children)
+                body_content = cleanup(body.decode_contents())
                 lines.append("\n{% block body %}")
                 lines.append(body_content)
                 lines.append("{% endblock %}\n")
@@ -620,7 +820,10 @@ class HTMLToTwigConverter:
                 lines.append("\n{% block javascripts %}")
                 lines.append("    {{ parent() }}")
                 for script in scripts:
-                    lines.append(f"    {script}")
+                    lines.append(f"    {cleanup(str(script))}")
                 lines.append("{% endblock %}\n")
 
         return "\n".join(lines)
+
+
+HTMLToTwigConverter._index_selector_tables()
@@ -0,0 +1,296 @@
+"""
+Conversion reports of the Twig and WordPress converters.
+
+The reports do not depend on BeautifulSoup, so a stored report (e.g. from
+the CLI's conversion cache) can be loaded without importing the parser.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+# Report separators and section headings
+_REPORT_RULE = "=" * 70
+_SECTION_RULE = "-" * 70
+_ASSETS_HEADING = f"{_SECTION_RULE}\nASSET CONVERSIONS\n{_SECTION_RULE}"
+_BLOCKS_HEADING = f"{_SECTION_RULE}\nBLOCK SUGGESTIONS\n{_SECTION_RULE}"
+_TEMPLATE_PARTS_HEADING = f"{_SECTION_RULE}\nTEMPLATE PARTS SUGGESTIONS\n{_SECTION_RULE}"
+_LOOPS_HEADING = f"{_SECTION_RULE}\nLOOP CONVERSIONS\n{_SECTION_RULE}"
+_SUGGESTIONS_HEADING = f"{_SECTION_RULE}\nMANUAL REVIEW SUGGESTIONS\n{_SECTION_RULE}"
+_WARNINGS_HEADING = f"{_SECTION_RULE}\nWARNINGS\n{_SECTION_RULE}"
+_REPORT_FOOTER = f"{_REPORT_RULE}\nEND OF REPORT\n{_REPORT_RULE}"
+
+
+def _asset_section(asset_conversions: list) -> str:
+    """Format the asset conversions section body shared by both reports."""
+    if not asset_conversions:
+        return "  No asset conversions performed.\n"
+    return "\n".join(
+        f"  [{conv.type.upper()}]\n"
+        f"    Before: {conv.original}\n"
+        f"    After:  {conv.converted}\n"
+        for conv in asset_conversions
+    )
+
+
+def _closing_sections(manual_suggestions: list, warnings: list) -> list:
+    """Return the suggestions, warnings and footer sections shared by both reports."""
+    if manual_suggestions:
+        suggestions = (
+            "\n".join(f"  {i}. {suggestion}" for i, suggestion in enumerate(manual_suggestions, 1))
+            + "\n"
+        )
+    else:
+        suggestions = "  No manual review needed.\n"
+    sections = [_SUGGESTIONS_HEADING, suggestions]
+
+    if warnings:
+        sections.append(_WARNINGS_HEADING)
+        sections.append("\n".join(f"  ⚠ {warning}" for warning in warnings) + "\n")
+
+    sections.append(_REPORT_FOOTER)
+    return sections
+
+
+class AssetConversion(NamedTuple):
+    """An asset reference rewritten during conversion."""
+
+    original: str
+    converted: str
+    type: str
+
+
+class BlockSuggestion(NamedTuple):
+    """A section of the page suggested as a Twig block."""
+
+    name: str
+    reason: str
+
+
+class LoopConversion(NamedTuple):
+    """A repeated element rewritten as a Twig for loop."""
+
+    element: str
+    items_var: str
+    item_var: str
+
+
+class TemplatePartSuggestion(NamedTuple):
+    """A section of the page suggested as a WordPress template part."""
+
+    name: str
+    reason: str
+
+
+class WordPressLoopConversion(NamedTuple):
+    """A repeated element turned into a WordPress menu or The Loop."""
+
+    element: str
+    loop_type: str
+
+
+# Reports carry no per-instance __dict__ where dataclasses support slots
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ConversionReport:
+    """Stores all conversions and suggestions made during the conversion process."""
+
+    input_file: str
+    output_file: str
+    layout: Optional[str] = None
+    asset_conversions: list = field(default_factory=list)
+    block_suggestions: list = field(default_factory=list)
+    loop_conversions: list = field(default_factory=list)
+    manual_suggestions: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+
+    def add_asset(self, original: str, converted: str, tag_type: str):
+        self.asset_conversions.append(AssetConversion(original, converted, tag_type))
+
+    def add_block(self, name: str, reason: str):
+        self.block_suggestions.append(BlockSuggestion(name, reason))
+
+    def add_loop(self, element: str, items_var: str, item_var: str):
+        self.loop_conversions.append(LoopConversion(element, items_var, item_var))
+
+    def add_suggestion(self, suggestion: str):
+        self.manual_suggestions.append(suggestion)
+
+    def add_warning(self, warning: str):
+        self.warnings.append(warning)
+
+    def generate_text(self) -> str:
+        """Generate a text report of all conversions."""
+        header = (
+            f"{_REPORT_RULE}\nHTML TO TWIG CONVERSION REPORT\n{_REPORT_RULE}\n\n"
+            f"Input:  {self.input_file}\nOutput: {self.output_file}"
+        )
+        if self.layout:
+            header += f"\nLayout: {self.layout}"
+
+        # Each section is built as one string; entries end with a blank line
+        sections = [header, "", _ASSETS_HEADING, _asset_section(self.asset_conversions)]
+
+        sections.append(_BLOCKS_HEADING)
+        if self.block_suggestions:
+            sections.append(
+                "\n".join(
+                    f"  {{% block {block.name} %}}\n    Reason: {block.reason}\n"
+                    for block in self.block_suggestions
+                )
+            )
+        else:
+            sections.append("  No block suggestions.\n")
+
+        sections.append(_LOOPS_HEADING)
+        if self.loop_conversions:
+            sections.append(
+                "\n".join(
+                    f"  Element: {loop.element}\n"
+                    f"    {{% for {loop.item_var} in {loop.items_var} %}}\n"
+                    for loop in self.loop_conversions
+                )
+            )
+        else:
+            sections.append("  No loop conversions performed.\n")
+
+        sections.extend(_closing_sections(self.manual_suggestions, self.warnings))
+
+        return "\n".join(sections)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ConversionReport":
+        """Rebuild a report from its dataclasses.asdict() form, e.g. after a JSON round trip."""
+        return cls(
+            input_file=data["input_file"],
+            output_file=data["output_file"],
+            layout=data["layout"],
+            asset_conversions=[AssetConversion(*entry) for entry in data["asset_conversions"]],
+            block_suggestions=[BlockSuggestion(*entry) for entry in data["block_suggestions"]],
+            loop_conversions=[LoopConversion(*entry) for entry in data["loop_conversions"]],
+            manual_suggestions=list(data["manual_suggestions"]),
+            warnings=list(data["warnings"]),
+        )
+
+
+class _NullConversionReport(ConversionReport):
+    """Report used when no report is requested; records nothing."""
+
+    __slots__ = ()
+
+    def add_asset(self, original: str, converted: str, tag_type: str):
+        pass
+
+    def add_block(self, name: str, reason: str):
+        pass
+
+    def add_loop(self, element: str, items_var: str, item_var: str):
+        pass
+
+    def add_suggestion(self, suggestion: str):
+        pass
+
+    def add_warning(self, warning: str):
+        pass
+
+
+@dataclass
+class WordPressConversionReport:
+    """Stores all conversions and suggestions for WordPress conversion."""
+
+    input_file: str
+    output_file: str
+    theme_name: str = "mytheme"
+    asset_conversions: list = field(default_factory=list)
+    template_parts: list = field(default_factory=list)
+    loop_conversions: list = field(default_factory=list)
+    manual_suggestions: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+
+    def add_asset(self, original: str, converted: str, tag_type: str):
+        self.asset_conversions.append(AssetConversion(original, converted, tag_type))
+
+    def add_template_part(self, name: str, reason: str):
+        self.template_parts.append(TemplatePartSuggestion(name, reason))
+
+    def add_loop(self, element: str, loop_type: str):
+        self.loop_conversions.append(WordPressLoopConversion(element, loop_type))
+
+    def add_suggestion(self, suggestion: str):
+        self.manual_suggestions.append(suggestion)
+
+    def add_warning(self, warning: str):
+        self.warnings.append(warning)
+
+    def generate_text(self) -> str:
+        """Generate a text report of all conversions."""
+        header = (
+            f"{_REPORT_RULE}\nHTML TO WORDPRESS CONVERSION REPORT\n{_REPORT_RULE}\n\n"
+            f"Input:  {self.input_file}\nOutput: {self.output_file}\nTheme:  {self.theme_name}"
+        )
+
+        # Each section is built as one string; entries end with a blank line
+        sections = [header, "", _ASSETS_HEADING, _asset_section(self.asset_conversions)]
+
+        sections.append(_TEMPLATE_PARTS_HEADING)
+        if self.template_parts:
+            sections.append(
+                "\n".join(
+                    f"  get_template_part('{part.name}')\n    Reason: {part.reason}\n"
+                    for part in self.template_parts
+                )
+            )
+        else:
+            sections.append("  No template part suggestions.\n")
+
+        sections.append(_LOOPS_HEADING)
+        if self.loop_conversions:
+            sections.append(
+                "\n".join(
+                    f"  Element: {loop.element}\n    Type: {loop.loop_type}\n"
+                    for loop in self.loop_conversions
+                )
+            )
+        else:
+            sections.append("  No loop conversions performed.\n")
+
+        sections.extend(_closing_sections(self.manual_suggestions, self.warnings))
+
+        return "\n".join(sections)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WordPressConversionReport":
+        """Rebuild a report from its dataclasses.asdict() form, e.g. after a JSON round trip."""
+        return cls(
+            input_file=data["input_file"],
+            output_file=data["output_file"],
+            theme_name=data["theme_name"],
+            asset_conversions=[AssetConversion(*entry) for entry in data["asset_conversions"]],
+            template_parts=[TemplatePartSuggestion(*entry) for entry in data["template_parts"]],
+            loop_conversions=[
+                WordPressLoopConversion(*entry) for entry in data["loop_conversions"]
+            ],
+            manual_suggestions=list(data["manual_suggestions"]),
+            warnings=list(data["warnings"]),
+        )
+
+
+class _NullWordPressConversionReport(WordPressConversionReport):
+    """Report used when no report is requested; records nothing."""
+
+    def add_asset(self, original: str, converted: str, tag_type: str):
+        pass
+
+    def add_template_part(self, name: str, reason: str):
+        pass
+
+    def add_loop(self, element: str, loop_type: str):
+        pass
+
+    def add_suggestion(self, suggestion: str):
+        pass
+
+    def add_warning(self, warning: str):
+        pass
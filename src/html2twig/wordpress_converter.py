@@ -3,109 +3,45 @@ HTML to WordPress PHP template converter module.
 """
 
 import re
-from dataclasses import dataclass, field
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from bs4 import BeautifulSoup, Tag, NavigableString
-
-
-@dataclass
-class WordPressConversionReport:
-    """Stores all conversions and suggestions for WordPress conversion."""
-
-    input_file: str
-    output_file: str
-    theme_name: str = "mytheme"
-    asset_conversions: list = field(default_factory=list)
-    template_parts: list = field(default_factory=list)
-    loop_conversions: list = field(default_factory=list)
-    manual_suggestions: list = field(default_factory=list)
-    warnings: list = field(default_factory=list)
-
-    def add_asset(self, original: str, converted: str, tag_type: str):
-        self.asset_conversions.append(
-            {"original": original, "converted": converted, "type": tag_type}
-        )
+from typing import Dict, List, Optional, Pattern, Set, Tuple, cast
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString
+
+from . import wordpress_templates
+from .wordpress_templates import _SLUGIFY
+from .converter import _DOTDOT_RE, _combine_patterns, _extension_type, _index_selectors
+from .report import WordPressConversionReport, _NullWordPressConversionReport
+
+
+# URL prefixes of references that are left untouched: remote URLs (and
+# references that name no file, such as #fragments and mailto: links),
+# inline data and values that are already PHP expressions
+_REMOTE_PREFIXES = ("http://", "https://", "//", "#", "mailto:", "tel:", "javascript:")
+_EXTERNAL_PREFIXES = _REMOTE_PREFIXES + ("data:", "<?php")
+_REMOTE_OR_PHP_PREFIXES = _REMOTE_PREFIXES + ("<?php",)
+_REMOTE_OR_DATA_PREFIXES = _REMOTE_PREFIXES + ("data:",)
+
+# Patterns used by the conversion steps, compiled once
+_URL_RE = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
+_EMPTY_PHP_RE = re.compile(r"<\?php\s*\?>")
+_SRCSET_CANDIDATE_RE = re.compile(r"([^\s,]+)([^,]*)")
+
 
-    def add_template_part(self, name: str, reason: str):
-        self.template_parts.append({"name": name, "reason": reason})
-
-    def add_loop(self, element: str, loop_type: str):
-        self.loop_conversions.append({"element": element, "loop_type": loop_type})
-
-    def add_suggestion(self, suggestion: str):
-        self.manual_suggestions.append(suggestion)
-
-    def add_warning(self, warning: str):
-        self.warnings.append(warning)
-
-    def generate_text(self) -> str:
-        """Generate a text report of all conversions."""
-        lines = [
-            "=" * 70,
-            "HTML TO WORDPRESS CONVERSION REPORT",
-            "=" * 70,
-            "",
-            f"Input:  {self.input_file}",
-            f"Output: {self.output_file}",
-            f"Theme:  {self.theme_name}",
-            "",
-            "-" * 70,
-            "ASSET CONVERSIONS",
-            "-" * 70,
-        ]
-
-        if self.asset_conversions:
-            for conv in self.asset_conversions:
-                lines.append(f"  [{conv['type'].upper()}]")
-                lines.append(f"    Before: {conv['original']}")
-                lines.append(f"    After:  {conv['converted']}")
-                lines.append("")
-        else:
-            lines.append("  No asset conversions performed.")
-            lines.append("")
-
-        lines.extend(["-" * 70, "TEMPLATE PARTS SUGGESTIONS", "-" * 70])
-
-        if self.template_parts:
-            for part in self.template_parts:
-                lines.append(f"  get_template_part('{part['name']}')")
-                lines.append(f"    Reason: {part['reason']}")
-                lines.append("")
-        else:
-            lines.append("  No template part suggestions.")
-            lines.append("")
-
-        lines.extend(["-" * 70, "LOOP CONVERSIONS", "-" * 70])
-
-        if self.loop_conversions:
-            for loop in self.loop_conversions:
-                lines.append(f"  Element: {loop['element']}")
-                lines.append(f"    Type: {loop['loop_type']}")
-                lines.append("")
-        else:
-            lines.append("  No loop conversions performed.")
-            lines.append("")
-
-        lines.extend(["-" * 70, "MANUAL REVIEW SUGGESTIONS", "-" * 70])
-
-        if self.manual_suggestions:
-            for i, suggestion in enumerate(self.manual_suggestions, 1):
-                lines.append(f"  {i}. {suggestion}")
-            lines.append("")
-        else:
-            lines.append("  No manual review needed.")
-            lines.append("")
-
-        if self.warnings:
-            lines.extend(["-" * 70, "WARNINGS", "-" * 70])
-            for warning in self.warnings:
-                lines.append(f"  ⚠ {warning}")
-            lines.append("")
-
-        lines.extend(["=" * 70, "END OF REPORT", "=" * 70])
-
-        return "\n".join(lines)
+class _PhpString(NavigableString):
+    """PHP code inserted into the tree; serialized as-is, without entity escaping."""
+
+    def output_ready(self, formatter="minimal") -> str:
+        return self.PREFIX + self + self.SUFFIX
+
+
+# Word separators in ids and class names, turned into spaces for menu names
+_DASH_UNDERSCORE = str.maketrans("-_", "  ")
+
+# Only the body is written to the template; the rest of the document only
+# contributes to the report
+_BODY_STRAINER = SoupStrainer("body")
 
 
 class HTMLToWordPressConverter:
@@ -130,6 +66,34 @@ class HTMLToWordPressConverter:
         "content": ["main", ".content", "#content", ".main-content", "[role='main']"],
     }
 
+    # Tags collected for the asset steps
+    COLLECTED_TAGS = {"img", "link", "script"}
+
+    # Containers checked for repeated children
+    CONTAINER_TAGS = {"div", "section", "article"}
+
+    # Built from the tables above by _index_selector_tables
+    _selector_names: Set[str]
+    _selector_index: Dict[Tuple[str, str], List[Tuple[Optional[str], str]]]
+    _collected_tags: Set[str]
+    _asset_re: Pattern[str]
+    _asset_types: Dict[int, str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override the selector or tag tables
+        cls._index_selector_tables()
+
+    @classmethod
+    def _index_selector_tables(cls):
+        """Index NAV_SELECTORS, TEMPLATE_PARTS and ASSET_PATTERNS once per class."""
+        cls._selector_names, cls._selector_index = _index_selectors(
+            cls.NAV_SELECTORS
+            + [selector for selectors in cls.TEMPLATE_PARTS.values() for selector in selectors]
+        )
+        cls._collected_tags = cls.COLLECTED_TAGS | cls._selector_names
+        cls._asset_re, cls._asset_types = _combine_patterns(cls.ASSET_PATTERNS)
+
     def __init__(self, theme_name: str = "mytheme"):
         """
         Initialize the WordPress converter.
@@ -140,6 +104,29 @@ class HTMLToWordPressConverter:
         self.theme_name = theme_name
         self.report: Optional[WordPressConversionReport] = None
         self.soup: Optional[BeautifulSoup] = None
+        # Tags removed from the tree along with a replaced menu, by id()
+        self._removed: Dict[int, Tag] = {}
+        self._asset_path_cache = lru_cache(maxsize=4096)(self._resolve_asset_path)
+
+    def reset(
+        self, input_path: str = "", output_path: str = "", generate_report: bool = True
+    ):
+        """
+        Clear per-file state so the converter can be reused for another file.
+
+        Args:
+            input_path: Path of the next input file (recorded in the report)
+            output_path: Path of the next output file (recorded in the report)
+            generate_report: Whether the next conversion should record a report
+        """
+        report_class = (
+            WordPressConversionReport if generate_report else _NullWordPressConversionReport
+        )
+        self.report = report_class(
+            input_file=input_path, output_file=output_path, theme_name=self.theme_name
+        )
+        self.soup = None
+        self._removed = {}
 
     def convert_file(
         self, input_path: str, output_path: str, generate_report: bool = True
@@ -154,30 +141,57 @@ class HTMLToWordPressConverter:
         Returns:
             Tuple of (converted content, report)
         """
-        with open(input_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        self.report = WordPressConversionReport(
-            input_file=input_path,
-            output_file=output_path,
-            theme_name=self.theme_name,
+        return self.convert_bytes(
+            Path(input_path).read_bytes(),
+            output_path,
+            generate_report=generate_report,
+            input_path=input_path,
         )
 
-        php_content = self.convert(html_content)
+    def convert_bytes(
+        self,
+        raw: bytes,
+        output_path: str,
+        generate_report: bool = True,
+        input_path: str = "",
+    ) -> tuple[str, Optional[WordPressConversionReport]]:
+        """
+        Convert already-read HTML bytes and save the result to a file.
+
+        Args:
+            raw: UTF-8 encoded HTML content (bytes or another buffer, e.g. an mmap)
+            output_path: Path to the output PHP file
+            generate_report: Whether to build and write the conversion report
+            input_path: Original input path, recorded in the report
+
+        Returns:
+            Tuple of (converted content, report or None)
+        """
+        html_content = str(raw, "utf-8")
+
+        self.reset(input_path, output_path, generate_report)
+
+        php_content = self._convert(html_content)
 
         # Save output
+        # The output directory usually exists already, so it is only
+        # created when writing the file fails
         output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(php_content)
+        try:
+            output.write_text(php_content, encoding="utf-8")
+        except FileNotFoundError:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(php_content, encoding="utf-8")
 
         # Generate report
         if generate_report:
-            report_path = str(output_path).rsplit(".", 1)[0] + "_report.txt"
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(self.report.generate_text())
+            report = self.report
+            assert report is not None
+            report_path = output.with_name(output.stem + "_report.txt")
+            report_path.write_text(report.generate_text(), encoding="utf-8")
+            return php_content, report
 
-        return php_content, self.report
+        return php_content, None
 
     def convert(self, html_content: str) -> str:
         """
@@ -189,82 +203,174 @@ class HTMLToWordPressConverter:
         Returns:
             Converted WordPress PHP template content
         """
-        self.soup = BeautifulSoup(html_content, "lxml")
+        self.reset()
+        return self._convert(html_content)
+
+    def _convert(self, html_content: str) -> str:
+        """Run the conversion pipeline, recording into the current report."""
+        # Without a report, nothing outside the body is used, so no objects
+        # are built for it; documents without a body are output whole
+        body_only = isinstance(self.report, _NullWordPressConversionReport)
+        soup = None
+        if body_only:
+            soup = BeautifulSoup(html_content, "lxml", parse_only=_BODY_STRAINER)
+        if soup is None or soup.body is None:
+            soup = BeautifulSoup(html_content, "lxml")
+        self.soup = soup
+
+        # Walk the tree once; the steps below work on the collected elements
+        found = self._collect_elements()
 
         # Convert assets
-        self._convert_images()
-        self._convert_stylesheets()
-        self._convert_scripts()
-        self._convert_other_assets()
+        self._convert_images(found["img"])
+        self._convert_stylesheets(found["link"])
+        self._convert_scripts(found["script"])
+        self._convert_other_assets(found["link"], found["[style]"])
 
         # Detect and convert navigation menus
-        self._convert_navigation()
+        self._convert_navigation(found)
 
-        # Detect template parts
-        self._detect_template_parts()
+        # The remaining steps only add report entries
+        if not body_only:
+            # Detect template parts
+            self._detect_template_parts(found)
 
-        # Detect repetitive elements for The Loop
-        self._detect_loop_elements()
+            # Detect repetitive elements for The Loop
+            self._detect_loop_elements(found["[container]"])
 
         # Generate PHP output
         php_content = self._generate_php_output()
 
         return php_content
 
-    def _convert_images(self):
+    def _collect_elements(self) -> defaultdict:
+        """
+        Walk the parsed tree once and group the elements the conversion steps use.
+
+        Returns:
+            Dict mapping each tag name in COLLECTED_TAGS, each selector in
+            NAV_SELECTORS and TEMPLATE_PARTS, "[container]" (CONTAINER_TAGS)
+            and "[style]" (elements with an inline style) to the matching
+            elements in document order
+        """
+        found = defaultdict(list)
+        collected_tags = self._collected_tags
+        container_tags = self.CONTAINER_TAGS
+        soup = self.soup
+        assert soup is not None
+
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            name = tag.name
+            attrs = tag.attrs
+            if name in collected_tags:
+                found[name].append(tag)
+            if name in container_tags:
+                found["[container]"].append(tag)
+            if "style" in attrs:
+                found["[style]"].append(tag)
+            if attrs:
+                self._add_selector_matches(found, tag)
+
+        return found
+
+    def _add_selector_matches(self, found: dict, tag: Tag):
+        """Append tag to the lists of the class, id and role selectors it matches."""
+        name = tag.name
+        attrs = tag.attrs
+        keys = [("class", cls) for cls in attrs.get("class", ())]
+        # Only class is a multi-valued attribute; id and role are strings
+        if "id" in attrs:
+            keys.append(("id", cast(str, attrs["id"])))
+        if "role" in attrs:
+            keys.append(("role", cast(str, attrs["role"])))
+        for key in keys:
+            for required_name, selector in self._selector_index.get(key, ()):
+                if required_name is None or required_name == name:
+                    matches = found[selector]
+                    # A repeated class must not list the element twice
+                    if not matches or matches[-1] is not tag:
+                        matches.append(tag)
+
+    def _in_document(self, tag: Tag) -> bool:
+        """Check whether tag is still part of the tree (not inside a replaced menu)."""
+        # A replaced menu is detached; its contents are marked when it is replaced
+        return tag.parent is not None and id(tag) not in self._removed
+
+    def _convert_images(self, images: list):
         """Convert image src attributes to WordPress get_template_directory_uri()."""
-        for img in self.soup.find_all("img"):
-            src = img.get("src", "")
-            if src and not src.startswith(("http://", "https://", "//", "data:", "<?php")):
+        report = self.report
+        assert report is not None
+        for img in images:
+            # The attribute dict is used directly rather than through
+            # Tag.get and Tag.__setitem__
+            attrs = img.attrs
+            src = attrs.get("src", "")
+            if src and not src.startswith(_EXTERNAL_PREFIXES):
                 new_src = self._convert_asset_path(src, "images")
                 if new_src != src:
-                    self.report.add_asset(src, new_src, "img")
-                    img["src"] = new_src
+                    report.add_asset(src, new_src, "img")
+                    attrs["src"] = new_src
 
             # Handle srcset
-            srcset = img.get("srcset", "")
+            srcset = attrs.get("srcset", "")
             if srcset and not srcset.startswith("<?php"):
                 new_srcset = self._convert_srcset(srcset)
                 if new_srcset != srcset:
-                    img["srcset"] = new_srcset
+                    attrs["srcset"] = new_srcset
 
-    def _convert_stylesheets(self):
+    def _convert_stylesheets(self, links: list):
         """Convert stylesheet href attributes to WordPress functions."""
-        for link in self.soup.find_all("link", rel="stylesheet"):
-            href = link.get("href", "")
-            if href and not href.startswith(("http://", "https://", "//", "<?php")):
+        report = self.report
+        assert report is not None
+        for link in links:
+            attrs = link.attrs
+            if "stylesheet" not in attrs.get("rel", ()):
+                continue
+            href = attrs.get("href", "")
+            if href and not href.startswith(_REMOTE_OR_PHP_PREFIXES):
                 new_href = self._convert_asset_path(href, "css")
                 if new_href != href:
-                    self.report.add_asset(href, new_href, "css")
-                    link["href"] = new_href
+                    report.add_asset(href, new_href, "css")
+                    attrs["href"] = new_href
 
-    def _convert_scripts(self):
+    def _convert_scripts(self, scripts: list):
         """Convert script src attributes to WordPress functions."""
-        for script in self.soup.find_all("script", src=True):
-            src = script.get("src", "")
-            if src and not src.startswith(("http://", "https://", "//", "<?php")):
+        report = self.report
+        assert report is not None
+        for script in scripts:
+            attrs = script.attrs
+            src = attrs.get("src", "")
+            if src and not src.startswith(_REMOTE_OR_PHP_PREFIXES):
                 new_src = self._convert_asset_path(src, "js")
                 if new_src != src:
-                    self.report.add_asset(src, new_src, "js")
-                    script["src"] = new_src
+                    report.add_asset(src, new_src, "js")
+                    attrs["src"] = new_src
 
-    def _convert_other_assets(self):
+    def _convert_other_assets(self, links: list, styled: list):
         """Convert other asset references."""
+        report = self.report
+        assert report is not None
         # Favicons
-        for link in self.soup.find_all("link", rel=lambda x: x and "icon" in x.lower()):
-            href = link.get("href", "")
-            if href and not href.startswith(("http://", "https://", "//", "<?php")):
+        for link in links:
+            attrs = link.attrs
+            if not any("icon" in rel.lower() for rel in attrs.get("rel", ())):
+                continue
+            href = attrs.get("href", "")
+            if href and not href.startswith(_REMOTE_OR_PHP_PREFIXES):
                 new_href = self._convert_asset_path(href, "images")
                 if new_href != href:
-                    self.report.add_asset(href, new_href, "favicon")
-                    link["href"] = new_href
+                    report.add_asset(href, new_href, "favicon")
+                    attrs["href"] = new_href
 
         # Background images in inline styles
-        for elem in self.soup.find_all(style=True):
-            style = elem["style"]
+        for elem in styled:
+            attrs = elem.attrs
+            style = attrs["style"]
             new_style = self._convert_inline_style_urls(style)
             if new_style != style:
-                elem["style"] = new_style
+                attrs["style"] = new_style
 
     def _convert_asset_path(self, path: str, default_type: str = "images") -> str:
         """
@@ -277,90 +383,99 @@ class HTMLToWordPressConverter:
         Returns:
             WordPress PHP expression or original path if external
         """
-        if not path or path.startswith(("http://", "https://", "//", "data:", "<?php")):
+        if not path or path.startswith(_EXTERNAL_PREFIXES):
             return path
 
+        # The result depends only on the path, and pages repeat the same
+        # assets many times, so lookups are memoised per converter
+        return self._asset_path_cache(path)
+
+    def _resolve_asset_path(self, path: str) -> str:
+        """Compute the WordPress PHP expression for a local asset path."""
         # Clean the path
         clean_path = path.strip()
 
-        # Try to match against known patterns
-        for asset_type, pattern in self.ASSET_PATTERNS.items():
-            match = pattern.match(clean_path)
-            if match:
-                filename = match.group(1)
-                return f"<?php echo esc_url(get_template_directory_uri() . '/{asset_type}/{filename}'); ?>"
+        # Try to match against known patterns, all in one match call
+        match = self._asset_re.match(clean_path)
+        if match:
+            # The matched alternative's group is the last one to close
+            group = match.lastindex
+            assert group is not None
+            asset_type = self._asset_types[group]
+            filename = match.group(group + 1)
+            return (
+                "<?php echo esc_url(get_template_directory_uri() . "
+                f"'/{asset_type}/{filename}'); ?>"
+            )
 
         # Fallback: use the path as-is
-        clean_path = re.sub(r"^(?:\.\.?/)+", "", clean_path)
+        clean_path = _DOTDOT_RE.sub("", clean_path)
 
         # Determine asset type from extension
-        ext = Path(clean_path).suffix.lower()
-        if ext in [".css", ".scss", ".sass", ".less"]:
-            return f"<?php echo esc_url(get_template_directory_uri() . '/css/{clean_path}'); ?>"
-        elif ext in [".js", ".mjs", ".ts"]:
-            return f"<?php echo esc_url(get_template_directory_uri() . '/js/{clean_path}'); ?>"
-        elif ext in [".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".avif"]:
-            return f"<?php echo esc_url(get_template_directory_uri() . '/images/{clean_path}'); ?>"
-        elif ext in [".woff", ".woff2", ".ttf", ".otf", ".eot"]:
-            return f"<?php echo esc_url(get_template_directory_uri() . '/fonts/{clean_path}'); ?>"
-        else:
-            return f"<?php echo esc_url(get_template_directory_uri() . '/{clean_path}'); ?>"
+        extension_type = _extension_type(clean_path)
+        if extension_type:
+            return (
+                "<?php echo esc_url(get_template_directory_uri() . "
+                f"'/{extension_type}/{clean_path}'); ?>"
+            )
+        return f"<?php echo esc_url(get_template_directory_uri() . '/{clean_path}'); ?>"
 
     def _convert_srcset(self, srcset: str) -> str:
         """Convert srcset attribute values to WordPress PHP."""
-        parts = srcset.split(",")
         new_parts = []
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            tokens = part.split()
-            if tokens:
-                url = tokens[0]
-                descriptor = " ".join(tokens[1:]) if len(tokens) > 1 else ""
-                new_url = self._convert_asset_path(url, "images")
-                if descriptor:
-                    new_parts.append(f"{new_url} {descriptor}")
-                else:
-                    new_parts.append(new_url)
+        # Each candidate is a URL followed by an optional descriptor
+        for match in _SRCSET_CANDIDATE_RE.finditer(srcset):
+            new_url = self._convert_asset_path(match.group(1), "images")
+            descriptor = " ".join(match.group(2).split())
+            if descriptor:
+                new_parts.append(f"{new_url} {descriptor}")
+            else:
+                new_parts.append(new_url)
         return ", ".join(new_parts)
 
     def _convert_inline_style_urls(self, style: str) -> str:
         """Convert url() in inline styles to WordPress PHP."""
-        url_pattern = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)', re.IGNORECASE)
-
         def replace_url(match):
             url = match.group(1)
-            if url.startswith(("http://", "https://", "//", "data:")):
+            if url.startswith(_REMOTE_OR_DATA_PREFIXES):
                 return match.group(0)
             new_url = self._convert_asset_path(url, "images")
             return f"url('{new_url}')"
 
-        return url_pattern.sub(replace_url, style)
+        return _URL_RE.sub(replace_url, style)
 
-    def _convert_navigation(self):
+    def _convert_navigation(self, found: dict):
         """Detect and convert navigation menus to WordPress wp_nav_menu()."""
         for selector in self.NAV_SELECTORS:
-            navs = self.soup.select(selector)
+            # Each selector sees the tree left by the previous ones: menus
+            # replaced earlier (and their contents) are no longer matched
+            navs = [nav for nav in found.get(selector, ()) if self._in_document(nav)]
             for nav in navs:
-                self._convert_nav_element(nav)
+                wp_menu = self._convert_nav_element(nav)
+                if wp_menu is not None:
+                    # The new <nav> keeps the class and id of the element it
+                    # replaces, so it can match the remaining selectors
+                    if "nav" in self._selector_names:
+                        found["nav"].append(wp_menu)
+                    self._add_selector_matches(found, wp_menu)
+
+    def _convert_nav_element(self, nav: Tag) -> Optional[Tag]:
+        """
+        Convert a navigation element to WordPress wp_nav_menu().
 
-    def _convert_nav_element(self, nav: Tag):
-        """Convert a navigation element to WordPress wp_nav_menu()."""
+        Returns:
+            The <nav> element that replaced it, or None
+        """
         # Find the list items
         items = nav.find_all("li", recursive=True)
         if len(items) < 2:
-            return
+            return None
 
         # Check if items have similar structure
         first_item = items[0]
-        similar_count = sum(
-            1 for item in items[1:] if self._elements_similar(first_item, item)
-        )
-
-        if similar_count >= len(items) // 2:
+        if self._has_similar(first_item, items[1:], len(items) // 2):
             menu_name = self._detect_menu_name(nav)
-            menu_location = menu_name.lower().replace(" ", "_").replace("-", "_")
+            menu_location = menu_name.lower().translate(_SLUGIFY)
 
             # Find the parent ul
             parent_ul = nav.find("ul") if nav.name != "ul" else nav
@@ -370,10 +485,12 @@ class HTMLToWordPressConverter:
                 ul_classes = " ".join(parent_ul.get("class", []))
 
                 # Create WordPress wp_nav_menu() call
+                nav_attrs = nav.attrs
                 wp_menu = self.soup.new_tag("nav")
-                wp_menu["class"] = nav.get("class", [])
-                if nav.get("id"):
-                    wp_menu["id"] = nav["id"]
+                wp_menu["class"] = nav_attrs.get("class", [])
+                nav_id = nav_attrs.get("id")
+                if nav_id:
+                    wp_menu["id"] = nav_id
 
                 php_code = f"""<?php
 wp_nav_menu(array(
@@ -383,9 +500,13 @@ wp_nav_menu(array(
     'fallback_cb'    => false,
 ));
 ?>"""
-                wp_menu.append(BeautifulSoup(php_code, "html.parser"))
+                wp_menu.append(_PhpString(php_code))
 
-                # Replace the original nav
+                # Replace the original nav; the dict keeps the removed tags
+                # alive so their ids are not reused by new tags
+                for elem in nav.descendants:
+                    if isinstance(elem, Tag):
+                        self._removed[id(elem)] = elem
                 nav.replace_with(wp_menu)
 
                 self.report.add_loop(f"Navigation menu: {menu_name}", "wp_nav_menu()")
@@ -393,58 +514,94 @@ wp_nav_menu(array(
                     f"Register menu location '{menu_location}' in functions.php:\n"
                     f"    register_nav_menus(array('{menu_location}' => __('{menu_name}', '{self.theme_name}')));"
                 )
+                return wp_menu
+        return None
 
     def _detect_menu_name(self, nav: Tag) -> str:
         """Detect a suitable name for the navigation menu."""
-        if nav.get("id"):
-            return nav["id"].replace("-", " ").replace("_", " ").title()
-        classes = nav.get("class", [])
-        for cls in classes:
-            if "nav" in cls.lower() or "menu" in cls.lower():
-                return cls.replace("-", " ").replace("_", " ").title()
-        if nav.get("aria-label"):
-            return nav["aria-label"]
+        attrs = nav.attrs
+        # id and aria-label are single-valued attributes, so bs4 keeps them as strings
+        nav_id = cast(Optional[str], attrs.get("id"))
+        if nav_id:
+            return nav_id.translate(_DASH_UNDERSCORE).title()
+        for cls in attrs.get("class", ()):
+            lowered = cls.lower()
+            if "nav" in lowered or "menu" in lowered:
+                return cls.translate(_DASH_UNDERSCORE).title()
+        aria_label = cast(Optional[str], attrs.get("aria-label"))
+        if aria_label:
+            return aria_label
         return "Primary Menu"
 
-    def _elements_similar(self, elem1: Tag, elem2: Tag) -> bool:
-        """Check if two elements have similar structure."""
-        if elem1.name != elem2.name:
-            return False
-        children1 = [c.name for c in elem1.children if isinstance(c, Tag)]
-        children2 = [c.name for c in elem2.children if isinstance(c, Tag)]
-        return children1 == children2
-
-    def _detect_template_parts(self):
+    def _count_similar(self, first: Tag, others) -> int:
+        """Count the elements in others with the same structure as first."""
+        # others may be a lazy iterable; the reference structure is only
+        # computed once another element with the same name turns up
+        name = first.name
+        child_names = None
+        count = 0
+        for elem in others:
+            if elem.name != name:
+                continue
+            if child_names is None:
+                child_names = self._child_names(first)
+            if self._child_names(elem) == child_names:
+                count += 1
+        return count
+
+    def _has_similar(self, first: Tag, others: list, needed: int) -> bool:
+        """Check whether at least `needed` elements in others have the same structure as first."""
+        # Stops as soon as the answer is known: enough matches were found,
+        # or too few elements are left to reach the threshold
+        name = first.name
+        child_names = self._child_names(first)
+        remaining = len(others)
+        for elem in others:
+            if needed <= 0:
+                return True
+            if remaining < needed:
+                return False
+            if elem.name == name and self._child_names(elem) == child_names:
+                needed -= 1
+            remaining -= 1
+        return needed <= 0
+
+    @staticmethod
+    def _child_names(elem: Tag) -> tuple:
+        """Return the names of an element's child tags."""
+        return tuple(c.name for c in elem.children if isinstance(c, Tag))
+
+    def _detect_template_parts(self, found: dict):
         """Detect common template parts and suggest get_template_part() calls."""
+        report = self.report
+        assert report is not None
         for part_name, selectors in self.TEMPLATE_PARTS.items():
             for selector in selectors:
-                try:
-                    elements = self.soup.select(selector)
-                    if elements:
-                        self.report.add_template_part(
-                            part_name, f"Detected {selector} element(s)"
-                        )
-                        self.report.add_suggestion(
-                            f"Consider extracting {selector} to template-parts/{part_name}.php"
-                        )
-                        break
-                except Exception:
-                    continue
-
-    def _detect_loop_elements(self):
+                if any(self._in_document(elem) for elem in found.get(selector, ())):
+                    report.add_template_part(
+                        part_name, f"Detected {selector} element(s)"
+                    )
+                    report.add_suggestion(
+                        f"Consider extracting {selector} to template-parts/{part_name}.php"
+                    )
+                    break
+
+    def _detect_loop_elements(self, containers: list):
         """Detect repetitive patterns that might use The Loop."""
+        report = self.report
+        assert report is not None
         # Look for repeated similar elements (posts, cards, etc.)
-        containers = self.soup.find_all(["div", "section", "article"])
-
         for container in containers:
-            children = [c for c in container.children if isinstance(c, Tag)]
-            if len(children) < 3:
+            # Skip containers removed along with a replaced menu
+            if not self._in_document(container):
                 continue
-
-            first_child = children[0]
-            similar_count = sum(
-                1 for c in children[1:] if self._elements_similar(first_child, c)
-            )
+            # Children are scanned lazily; two matches after the first child
+            # already imply the three children a loop needs
+            children = (c for c in container.children if isinstance(c, Tag))
+            first_child = next(children, None)
+            if first_child is None:
+                continue
+            similar_count = self._count_similar(first_child, children)
 
             if similar_count >= 2:
                 container_id = (
@@ -453,28 +610,27 @@ wp_nav_menu(array(
                 )
 
                 # Check if it looks like a post list
-                if first_child.name == "article" or "post" in str(first_child.get("class", [])).lower():
-                    self.report.add_loop(
+                if first_child.name == "article" or any(
+                    "post" in cls.lower() for cls in first_child.attrs.get("class", ())
+                ):
+                    report.add_loop(
                         f"Post list in '{container_id}'",
                         "WordPress The Loop (while have_posts())"
                     )
-                    self.report.add_suggestion(
+                    report.add_suggestion(
                         f"Replace repeated articles in '{container_id}' with WordPress The Loop:\n"
                         f"    <?php if (have_posts()) : while (have_posts()) : the_post(); ?>\n"
                         f"        <?php get_template_part('template-parts/content', get_post_type()); ?>\n"
                         f"    <?php endwhile; endif; ?>"
                     )
                 else:
-                    self.report.add_suggestion(
+                    report.add_suggestion(
                         f"Consider using a loop for repeated elements in '{container_id}' "
                         f"({similar_count + 1} similar children found)"
                     )
 
     def _generate_php_output(self) -> str:
         """Generate the final WordPress PHP template output."""
-        # Get the HTML output
-        html = str(self.soup)
-
         # Add PHP header
         php_header = """<?php
 /**
@@ -495,12 +651,12 @@ get_sidebar();
 get_footer();
 """
 
-        # Extract body content only
-        body_match = re.search(r"<body[^>]*>(.*?)</body>", html, re.DOTALL | re.IGNORECASE)
-        if body_match:
-            body_content = body_match.group(1)
-        else:
-            body_content = html
+        # Serialize only the body content; the rest of the document is
+        # provided by header.php and footer.php
+        soup = self.soup
+        assert soup is not None
+        body = soup.body
+        body_content = body.decode_contents() if body else str(soup)
 
         # Clean up the content
         body_content = self._cleanup_php_output(body_content)
@@ -510,7 +666,7 @@ get_footer();
     def _cleanup_php_output(self, content: str) -> str:
         """Clean up the PHP output."""
         # Remove empty PHP tags
-        content = re.sub(r"<\?php\s*\?>", "", content)
+        content = _EMPTY_PHP_RE.sub("", content)
 
         # Fix any broken PHP
         content = content.replace("&lt;?php", "<?php")
@@ -518,135 +674,37 @@ get_footer();
 
         return content
 
-    def generate_functions_php(self) -> str:
-        """Generate a basic functions.php with menu registrations."""
-        menus = []
-        for loop in self.report.loop_conversions:
-            if loop["loop_type"] == "wp_nav_menu()":
-                menu_name = loop["element"].replace("Navigation menu: ", "")
-                menu_location = menu_name.lower().replace(" ", "_")
-                menus.append(f"        '{menu_location}' => __('{menu_name}', '{self.theme_name}'),")
-
-        menu_registration = "\n".join(menus) if menus else "        'primary' => __('Primary Menu', '{theme_name}'),".format(theme_name=self.theme_name)
-
-        return f"""<?php
-/**
- * {self.theme_name} functions and definitions
- *
- * @package {self.theme_name}
- */
-
-if (!defined('ABSPATH')) {{
-    exit;
-}}
-
-/**
- * Theme setup
- */
-function {self.theme_name.lower().replace(' ', '_')}_setup() {{
-    // Add theme support
-    add_theme_support('title-tag');
-    add_theme_support('post-thumbnails');
-    add_theme_support('html5', array(
-        'search-form',
-        'comment-form',
-        'comment-list',
-        'gallery',
-        'caption',
-        'style',
-        'script',
-    ));
-
-    // Register navigation menus
-    register_nav_menus(array(
-{menu_registration}
-    ));
-}}
-add_action('after_setup_theme', '{self.theme_name.lower().replace(' ', '_')}_setup');
+    def generate_functions_php(
+        self, report: Optional[WordPressConversionReport] = None
+    ) -> str:
+        """
+        Generate a basic functions.php with menu registrations.
 
-/**
- * Enqueue scripts and styles
- */
-function {self.theme_name.lower().replace(' ', '_')}_scripts() {{
-    wp_enqueue_style('{self.theme_name.lower().replace(' ', '_')}-style', get_stylesheet_uri(), array(), '1.0.0');
+        Args:
+            report: Report whose menus to register; defaults to the report of
+                the last conversion. Without either, only a primary menu is
+                registered.
+        """
+        if report is None:
+            report = self.report
+        if report is None:
+            return wordpress_templates.functions_php(self.theme_name)
 
-    // Add your custom CSS files here
-    // wp_enqueue_style('custom-css', get_template_directory_uri() . '/css/custom.css', array(), '1.0.0');
+        menus = []
+        for loop in report.loop_conversions:
+            if loop.loop_type == "wp_nav_menu()":
+                menu_name = loop.element.replace("Navigation menu: ", "")
+                menus.append((menu_name.lower().translate(_SLUGIFY), menu_name))
 
-    // Add your custom JS files here
-    // wp_enqueue_script('custom-js', get_template_directory_uri() . '/js/custom.js', array('jquery'), '1.0.0', true);
-}}
-add_action('wp_enqueue_scripts', '{self.theme_name.lower().replace(' ', '_')}_scripts');
-"""
+        return wordpress_templates.functions_php(self.theme_name, menus)
 
     def generate_header_php(self) -> str:
         """Generate a basic header.php template."""
-        return f"""<?php
-/**
- * Header template
- *
- * @package {self.theme_name}
- */
-
-if (!defined('ABSPATH')) {{
-    exit;
-}}
-?>
-<!DOCTYPE html>
-<html <?php language_attributes(); ?>>
-<head>
-    <meta charset="<?php bloginfo('charset'); ?>">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <?php wp_head(); ?>
-</head>
-<body <?php body_class(); ?>>
-<?php wp_body_open(); ?>
-
-<header id="masthead" class="site-header">
-    <div class="site-branding">
-        <?php if (has_custom_logo()) : ?>
-            <?php the_custom_logo(); ?>
-        <?php else : ?>
-            <h1 class="site-title"><a href="<?php echo esc_url(home_url('/')); ?>"><?php bloginfo('name'); ?></a></h1>
-        <?php endif; ?>
-    </div>
-
-    <nav id="site-navigation" class="main-navigation">
-        <?php
-        wp_nav_menu(array(
-            'theme_location' => 'primary',
-            'menu_class'     => 'primary-menu',
-            'container'      => false,
-        ));
-        ?>
-    </nav>
-</header>
-
-<main id="primary" class="site-main">
-"""
+        return wordpress_templates.header_php(self.theme_name)
 
     def generate_footer_php(self) -> str:
         """Generate a basic footer.php template."""
-        return f"""<?php
-/**
- * Footer template
- *
- * @package {self.theme_name}
- */
+        return wordpress_templates.footer_php(self.theme_name)
 
-if (!defined('ABSPATH')) {{
-    exit;
-}}
-?>
-</main>
 
-<footer id="colophon" class="site-footer">
-    <div class="site-info">
-        <p>&copy; <?php echo date('Y'); ?> <?php bloginfo('name'); ?>. All rights reserved.</p>
-    </div>
-</footer>
-
-<?php wp_footer(); ?>
-</body>
-</html>
-"""
+HTMLToWordPressConverter._index_selector_tables()
@@ -0,0 +1,284 @@
+"""
+Static WordPress theme file templates.
+
+These depend only on the theme name (and the registered menus), so the
+``init`` command can write them without running a conversion.
+"""
+
+# Maps the separators in theme and menu names to underscores, so the
+# result is usable in PHP identifiers and menu locations
+_SLUGIFY = str.maketrans({" ": "_", "-": "_"})
+
+# Templates that only substitute the theme name
+_STYLE_CSS = """/*
+Theme Name: {theme_title}
+Theme URI: https://example.com/{theme_name}
+Author: Your Name
+Author URI: https://example.com
+Description: A custom WordPress theme converted from HTML
+Version: 1.0.0
+License: GNU General Public License v2 or later
+License URI: http://www.gnu.org/licenses/gpl-2.0.html
+Text Domain: {theme_name}
+*/
+
+/* Add your custom styles below */
+"""
+
+_INDEX_PHP = """<?php
+/**
+ * Main template file
+ *
+ * @package {theme_name}
+ */
+
+get_header();
+?>
+
+<div id="primary" class="content-area">
+    <?php
+    if (have_posts()) :
+        while (have_posts()) :
+            the_post();
+            get_template_part('template-parts/content', get_post_type());
+        endwhile;
+
+        the_posts_navigation();
+    else :
+        get_template_part('template-parts/content', 'none');
+    endif;
+    ?>
+</div>
+
+<?php
+get_sidebar();
+get_footer();
+"""
+
+_SIDEBAR_PHP = """<?php
+/**
+ * Sidebar template
+ *
+ * @package {theme_name}
+ */
+
+if (!is_active_sidebar('sidebar-1')) {{
+    return;
+}}
+?>
+
+<aside id="secondary" class="widget-area">
+    <?php dynamic_sidebar('sidebar-1'); ?>
+</aside>
+"""
+
+_CONTENT_PHP = """<?php
+/**
+ * Template part for displaying posts
+ *
+ * @package {theme_name}
+ */
+?>
+
+<article id="post-<?php the_ID(); ?>" <?php post_class(); ?>>
+    <header class="entry-header">
+        <?php
+        if (is_singular()) :
+            the_title('<h1 class="entry-title">', '</h1>');
+        else :
+            the_title('<h2 class="entry-title"><a href="' . esc_url(get_permalink()) . '">', '</a></h2>');
+        endif;
+        ?>
+    </header>
+
+    <?php if (has_post_thumbnail()) : ?>
+    <div class="post-thumbnail">
+        <?php the_post_thumbnail(); ?>
+    </div>
+    <?php endif; ?>
+
+    <div class="entry-content">
+        <?php
+        if (is_singular()) :
+            the_content();
+        else :
+            the_excerpt();
+        endif;
+        ?>
+    </div>
+
+    <footer class="entry-footer">
+        <?php
+        if ('post' === get_post_type()) :
+            ?>
+            <span class="posted-on"><?php echo get_the_date(); ?></span>
+            <span class="byline"><?php the_author_posts_link(); ?></span>
+            <?php
+        endif;
+        ?>
+    </footer>
+</article>
+"""
+
+
+def functions_php(theme_name: str, menus=()) -> str:
+    """Generate a basic functions.php registering the given menus.
+
+    ``menus`` is a sequence of ``(location, name)`` pairs; a primary menu is
+    registered when it is empty.
+    """
+    menu_registration = (
+        "\n".join(
+            f"        '{location}' => __('{name}', '{theme_name}')," for location, name in menus
+        )
+        or f"        'primary' => __('Primary Menu', '{theme_name}'),"
+    )
+
+    # Prefix of the PHP function and handle names
+    slug = theme_name.lower().translate(_SLUGIFY)
+
+    return f"""<?php
+/**
+ * {theme_name} functions and definitions
+ *
+ * @package {theme_name}
+ */
+
+if (!defined('ABSPATH')) {{
+    exit;
+}}
+
+/**
+ * Theme setup
+ */
+function {slug}_setup() {{
+    // Add theme support
+    add_theme_support('title-tag');
+    add_theme_support('post-thumbnails');
+    add_theme_support('html5', array(
+        'search-form',
+        'comment-form',
+        'comment-list',
+        'gallery',
+        'caption',
+        'style',
+        'script',
+    ));
+
+    // Register navigation menus
+    register_nav_menus(array(
+{menu_registration}
+    ));
+}}
+add_action('after_setup_theme', '{slug}_setup');
+
+/**
+ * Enqueue scripts and styles
+ */
+function {slug}_scripts() {{
+    wp_enqueue_style('{slug}-style', get_stylesheet_uri(), array(), '1.0.0');
+
+    // Add your custom CSS files here
+    // wp_enqueue_style('custom-css', get_template_directory_uri() . '/css/custom.css', array(), '1.0.0');
+
+    // Add your custom JS files here
+    // wp_enqueue_script('custom-js', get_template_directory_uri() . '/js/custom.js', array('jquery'), '1.0.0', true);
+}}
+add_action('wp_enqueue_scripts', '{slug}_scripts');
+"""
+
+
+def header_php(theme_name: str) -> str:
+    """Generate a basic header.php template."""
+    return f"""<?php
+/**
+ * Header template
+ *
+ * @package {theme_name}
+ */
+
+if (!defined('ABSPATH')) {{
+    exit;
+}}
+?>
+<!DOCTYPE html>
+<html <?php language_attributes(); ?>>
+<head>
+    <meta charset="<?php bloginfo('charset'); ?>">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <?php wp_head(); ?>
+</head>
+<body <?php body_class(); ?>>
+<?php wp_body_open(); ?>
+
+<header id="masthead" class="site-header">
+    <div class="site-branding">
+        <?php if (has_custom_logo()) : ?>
+            <?php the_custom_logo(); ?>
+        <?php else : ?>
+            <h1 class="site-title"><a href="<?php echo esc_url(home_url('/')); ?>"><?php bloginfo('name'); ?></a></h1>
+        <?php endif; ?>
+    </div>
+
+    <nav id="site-navigation" class="main-navigation">
+        <?php
+        wp_nav_menu(array(
+            'theme_location' => 'primary',
+            'menu_class'     => 'primary-menu',
+            'container'      => false,
+        ));
+        ?>
+    </nav>
+</header>
+
+<main id="primary" class="site-main">
+"""
+
+
+def footer_php(theme_name: str) -> str:
+    """Generate a basic footer.php template."""
+    return f"""<?php
+/**
+ * Footer template
+ *
+ * @package {theme_name}
+ */
+
+if (!defined('ABSPATH')) {{
+    exit;
+}}
+?>
+</main>
+
+<footer id="colophon" class="site-footer">
+    <div class="site-info">
+        <p>&copy; <?php echo date('Y'); ?> <?php bloginfo('name'); ?>. All rights reserved.</p>
+    </div>
+</footer>
+
+<?php wp_footer(); ?>
+</body>
+</html>
+"""
+
+
+def style_css(theme_name: str) -> str:
+    """Generate the style.css theme header."""
+    return _STYLE_CSS.format(
+        theme_name=theme_name, theme_title=theme_name.replace("_", " ").title()
+    )
+
+
+def index_php(theme_name: str) -> str:
+    """Generate the main index.php template."""
+    return _INDEX_PHP.format(theme_name=theme_name)
+
+
+def sidebar_php(theme_name: str) -> str:
+    """Generate a basic sidebar.php template."""
+    return _SIDEBAR_PHP.format(theme_name=theme_name)
+
+
+def content_php(theme_name: str) -> str:
+    """Generate the template-parts/content.php template."""
+    return _CONTENT_PHP.format(theme_name=theme_name)
@@ -1,5 +1,8 @@
 """Tests for the HTML to Twig converter."""
 
+import json
+from dataclasses import asdict
+
 import pytest
 from html2twig.converter import HTMLToTwigConverter, ConversionReport
 
@@ -28,6 +31,14 @@ class TestAssetConversion:
         result = converter.convert(html)
         assert "{{ asset('js/app.js') }}" in result
 
+    def test_convert_with_other_parser(self):
+        """Test that the BeautifulSoup parser can be chosen per converter."""
+        html = '<img src="../images/logo.png" alt="Logo">'
+        converter = HTMLToTwigConverter(parser="html.parser")
+        result = converter.convert(html)
+        assert "{{ asset('images/logo.png') }}" in result
+        assert "<body>" not in result
+
     def test_skip_external_urls(self):
         """Test that external URLs are not converted."""
         html = '<img src="https://example.com/image.png">'
@@ -44,6 +55,14 @@ class TestAssetConversion:
         assert "data:image/png;base64,abc123" in result
         assert "asset(" not in result
 
+    def test_skip_fragment_urls(self):
+        """Test that in-page fragment references are not converted."""
+        html = '<div style="fill: url(#gradient)"><img src="#"></div>'
+        converter = HTMLToTwigConverter()
+        result = converter.convert(html)
+        assert "url(#gradient)" in result
+        assert "asset(" not in result
+
     def test_convert_nested_asset_paths(self):
         """Test conversion of nested asset paths."""
         html = '<img src="../../assets/img/photo.jpg">'
@@ -86,6 +105,38 @@ class TestNavigationConversion:
         assert "{% for item in" in result
         assert "{% endfor %}" in result
 
+    def test_nav_loop_uses_top_level_items(self):
+        """Test that items of nested sub-menus are not wrapped in the loop."""
+        html = """
+        <nav class="main-nav">
+            <ul>
+                <li><a href="/about">About</a>
+                    <ul>
+                        <li><a href="/team">Team</a></li>
+                        <li><a href="/history">History</a></li>
+                    </ul>
+                </li>
+                <li><a href="/news">News</a>
+                    <ul>
+                        <li><a href="/events">Events</a></li>
+                        <li><a href="/press">Press</a></li>
+                    </ul>
+                </li>
+                <li><a href="/contact">Contact</a>
+                    <ul>
+                        <li><a href="/map">Map</a></li>
+                        <li><a href="/jobs">Jobs</a></li>
+                    </ul>
+                </li>
+            </ul>
+        </nav>
+        """
+        converter = HTMLToTwigConverter()
+        result = converter.convert(html)
+        assert result.count("{% for item in") == 1
+        assert "/team" in result
+        assert "/news" not in result
+
 
 class TestBlockDetection:
     """Test block detection and suggestions."""
@@ -95,7 +146,7 @@ class TestBlockDetection:
         html = "<header><h1>Title</h1></header>"
         converter = HTMLToTwigConverter()
         converter.convert(html)
-        block_names = [b["name"] for b in converter.report.block_suggestions]
+        block_names = [b.name for b in converter.report.block_suggestions]
         assert "header" in block_names
 
     def test_detect_footer_block(self):
@@ -103,7 +154,7 @@ class TestBlockDetection:
         html = "<footer><p>Copyright</p></footer>"
         converter = HTMLToTwigConverter()
         converter.convert(html)
-        block_names = [b["name"] for b in converter.report.block_suggestions]
+        block_names = [b.name for b in converter.report.block_suggestions]
         assert "footer" in block_names
 
     def test_detect_sidebar_block(self):
@@ -111,7 +162,7 @@ class TestBlockDetection:
         html = '<aside class="sidebar"><p>Sidebar</p></aside>'
         converter = HTMLToTwigConverter()
         converter.convert(html)
-        block_names = [b["name"] for b in converter.report.block_suggestions]
+        block_names = [b.name for b in converter.report.block_suggestions]
         assert "sidebar" in block_names
 
 
@@ -132,6 +183,13 @@ class TestLayoutInheritance:
         result = converter.convert(html)
         assert "{% extends" not in result
 
+    def test_body_block_keeps_comments_and_entities(self):
+        """Test that top-level body content is serialized like nested content."""
+        html = "<html><body><!-- hero -->Tom &amp; Jerry<p>Content</p></body></html>"
+        converter = HTMLToTwigConverter(layout="base")
+        result = converter.convert(html)
+        assert "<!-- hero -->Tom &amp; Jerry<p>Content</p>" in result
+
 
 class TestConversionReport:
     """Test the conversion report generation."""
@@ -161,6 +219,73 @@ class TestConversionReport:
         assert "logo.png" in text
         assert "header" in text
 
+    def test_report_rebuilt_from_dict(self):
+        """Test that a report survives a JSON round trip of its dict form."""
+        converter = HTMLToTwigConverter()
+        converter.convert('<img src="../images/logo.png"><header><h1>Title</h1></header>')
+        report = converter.report
+        restored = ConversionReport.from_dict(json.loads(json.dumps(asdict(report))))
+        assert restored == report
+        assert restored.generate_text() == report.generate_text()
+
+    def test_report_reset_between_conversions(self):
+        """Test that reusing a converter starts each conversion with a fresh report."""
+        converter = HTMLToTwigConverter()
+        converter.convert('<img src="../images/logo.png">')
+        converter.convert('<script src="../js/app.js"></script>')
+        assert len(converter.report.asset_conversions) == 1
+        assert converter.report.asset_conversions[0].type == "js"
+
+
+class TestFileConversion:
+    """Test converting files and in-memory bytes to output files."""
+
+    def test_convert_bytes_writes_output_and_report(self, tmp_path):
+        """Test that convert_bytes saves the template and its report."""
+        output = tmp_path / "page.html.twig"
+        converter = HTMLToTwigConverter()
+        content, report = converter.convert_bytes(
+            b'<img src="../images/logo.png">', str(output), input_path="page.html"
+        )
+        assert output.read_text(encoding="utf-8") == content
+        assert "{{ asset('images/logo.png') }}" in content
+        assert report.input_file == "page.html"
+        assert (tmp_path / "page.html_report.txt").exists()
+
+    def test_convert_bytes_without_report(self, tmp_path):
+        """Test that no report is built or written when it is not requested."""
+        output = tmp_path / "page.html.twig"
+        converter = HTMLToTwigConverter()
+        content, report = converter.convert_bytes(
+            b'<img src="../images/logo.png">', str(output), generate_report=False
+        )
+        assert "{{ asset('images/logo.png') }}" in content
+        assert report is None
+        assert converter.report.asset_conversions == []
+        assert not (tmp_path / "page.html_report.txt").exists()
+
+    def test_convert_accepts_bytes_in_declared_encoding(self):
+        """Test that bytes are decoded using the document's declared charset."""
+        html = '<head><meta charset="iso-8859-1"></head><p>Caf\xe9</p>'.encode("latin-1")
+        converter = HTMLToTwigConverter()
+        result = converter.convert(html)
+        assert "<p>Caf\xe9</p>" in result
+
+    def test_convert_files_keeps_order(self, tmp_path):
+        """Test that batch conversion returns results in input order."""
+        pairs = []
+        for name in ("one", "two", "three"):
+            source = tmp_path / f"{name}.html"
+            source.write_text(f'<h1>{name}</h1><img src="../images/{name}.png">')
+            pairs.append((str(source), str(tmp_path / "out" / f"{name}.html.twig")))
+
+        converter = HTMLToTwigConverter()
+        results = converter.convert_files(pairs, workers=2)
+
+        assert [report.output_file for _, report in results] == [out for _, out in pairs]
+        assert "{{ asset('images/two.png') }}" in results[1][0]
+        assert (tmp_path / "out" / "three.html_report.txt").exists()
+
 
 class TestRepetitivePatterns:
     """Test detection of repetitive patterns."""
@@ -179,6 +304,23 @@ class TestRepetitivePatterns:
         converter.convert(html)
         assert len(converter.report.manual_suggestions) > 0
 
+    def test_detect_cards_after_heading(self):
+        """Test that repeated elements are detected when they follow a heading."""
+        html = """
+        <section id="features">
+            <h2>Features</h2>
+            <div class="card"><h3>Card 1</h3><p>Content</p></div>
+            <div class="card"><h3>Card 2</h3><p>Content</p></div>
+            <div class="card"><h3>Card 3</h3><p>Content</p></div>
+        </section>
+        """
+        converter = HTMLToTwigConverter()
+        converter.convert(html)
+        assert any(
+            "'features' (3 similar children found)" in suggestion
+            for suggestion in converter.report.manual_suggestions
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])